@@ -1,3 +1,4 @@
+from operator import attrgetter, itemgetter
 from typing import Union
 from .pagination import Pagination
 
@@ -27,18 +28,32 @@ class FeatureSchemaAssembler:
         return new_dict or None
 
     def _build_non_none_dict(self, schema):
-        schema_dict = schema.model_dump() if hasattr(schema, "model_dump") else schema
+        if hasattr(schema, "model_dump"):
+            # Let pydantic drop None fields while serializing; the walk below
+            # still prunes dicts that end up empty
+            schema_dict = schema.model_dump(exclude_none=True)
+        else:
+            schema_dict = schema
         updated_dict = self._remove_none_from_dict(schema_dict)
         return updated_dict
 
+    def _build_list_result_dict(self, list_key: str, items: list, next_cursor=None):
+        # Items are definition dicts that were already validated and pruned,
+        # so wrapping them in a list result model again would only re-validate
+        # and re-dump every entry
+        result = {list_key: items}
+        if next_cursor is not None:
+            result["nextCursor"] = next_cursor
+        return result
+
     def _append_sorted_list(
         self, target_list: list, obj: Union[dict, object], sort_key_name: str
     ):
-        sort_key = (
-            lambda x: x[sort_key_name]
-            if isinstance(x, dict)
-            else getattr(x, sort_key_name)
-        )
+        # Pick the accessor once rather than per comparison
+        if isinstance(obj, dict):
+            sort_key = itemgetter(sort_key_name)
+        else:
+            sort_key = attrgetter(sort_key_name)
 
         target_list.append(obj)
         target_list.sort(key=sort_key)
@@ -43,6 +43,8 @@ class FeatureContainer:
             )
 
     def _get_function_metadata(self, func):
+        # FunctionParser caches parsed metadata per function and hands back a
+        # copy, so registering the same function again skips parsing
         return FunctionParser(func).function_metadata
 
     def _get_registry(self, registrations, key):
@@ -1,14 +1,52 @@
 from typing import Union, BinaryIO
 import os
-import base64
+import re
 from enum import Enum
+from .definitions import ContentTypes
+
+
+# URI schemes served over the network rather than by a registered resource
+HTTP_URI_PREFIXES = ("http://", "https://")
+
+
+# Base64 alphabet run followed by its padding; matched against the input as is
+_BASE64_RE = re.compile(r"[A-Za-z0-9+/]*(=*)")
+_BASE64_BYTES_RE = re.compile(_BASE64_RE.pattern.encode("ascii"))
+
+
+def is_base64(data: Union[str, bytes]) -> bool:
+    """Check that data is canonical padded base64 without decoding it.
+
+    The input must be whole 4-character groups of the standard alphabet,
+    with at most two "=" padding characters at the end. Unpadded input and
+    excess padding are rejected.
+    """
+    pattern = _BASE64_RE if isinstance(data, str) else _BASE64_BYTES_RE
+    match = pattern.match(data)
+    if match.end() != len(data):
+        return False
+    padding = len(data) - match.start(1)
+    return padding <= 2 and len(data) % 4 == 0
+
+
+# Extension mappings per MimeTypeMapper subclass, built on first lookup
+_EXTENSION_MAPPINGS = {}
 
 
 class MimeTypeMapper(Enum):
     @classmethod
     def _get_file_name_extension(cls, file_name: str) -> str:
-        _, ext = os.path.splitext(file_name)
-        return ext.lower()
+        # Same result as os.path.splitext, without its generic path handling
+        head, dot, ext = file_name.rpartition(".")
+        if not dot or os.sep in ext or (os.altsep and os.altsep in ext):
+            return ""
+        stem = head.rpartition(os.sep)[2]
+        if os.altsep:
+            stem = stem.rpartition(os.altsep)[2]
+        if not stem.strip("."):
+            # Leading dots (".bashrc") do not start an extension
+            return ""
+        return "." + ext.lower()
 
     @classmethod
     def _get_file_extension_mapping(cls) -> dict:
@@ -16,8 +54,11 @@ class MimeTypeMapper(Enum):
 
     @classmethod
     def from_file_name(cls, file_name: str) -> str:
+        mapping = _EXTENSION_MAPPINGS.get(cls)
+        if mapping is None:
+            mapping = _EXTENSION_MAPPINGS[cls] = cls._get_file_extension_mapping()
         ext = cls._get_file_name_extension(file_name)
-        return cls._get_file_extension_mapping().get(ext, None)
+        return mapping.get(ext, None)
 
 
 class MimeTypes:
@@ -138,11 +179,35 @@ class MimeTypes:
             }
             return mapping
 
+    @classmethod
+    def get_content_candidates(cls, file_name: str) -> tuple:
+        """Return the (content_type, mime_type) pairs matching a file name.
+
+        Candidates are ordered text, image, audio, the order files are tried in;
+        an extension can map to more than one (".svg" is text or image).
+        """
+        ext = MimeTypeMapper._get_file_name_extension(file_name)
+        return _CONTENT_CANDIDATES.get(ext, ())
+
     @classmethod
     def get_mime_type(cls, file_name: str) -> str:
-        mime_type = cls.Text.from_file_name(file_name)
-        if not mime_type:
-            mime_type = cls.Image.from_file_name(file_name)
-        if not mime_type:
-            mime_type = cls.Audio.from_file_name(file_name)
-        return mime_type
+        # The first candidate follows the text, image, audio precedence
+        for _, mime_type in cls.get_content_candidates(file_name):
+            return mime_type
+        return None
+
+
+def _build_content_candidates() -> dict:
+    candidates = {}
+    for content_type, mapper in (
+        (ContentTypes.TEXT, MimeTypes.Text),
+        (ContentTypes.IMAGE, MimeTypes.Image),
+        (ContentTypes.AUDIO, MimeTypes.Audio),
+    ):
+        for ext, mime_type in mapper._get_file_extension_mapping().items():
+            candidates[ext] = candidates.get(ext, ()) + ((content_type, mime_type),)
+    return candidates
+
+
+# Extension to every (content_type, mime_type) it may hold, built once at import
+_CONTENT_CANDIDATES = _build_content_candidates()
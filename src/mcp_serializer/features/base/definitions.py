@@ -1,5 +1,9 @@
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
+import sys
+
+# Drop the per-instance __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class Empty:
@@ -29,9 +33,14 @@ class FileMetadata:
     uri: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ArgumentMetadata:
-    """Metadata for a function argument."""
+    """Metadata for a function argument.
+
+    Frozen because the metadata FunctionParser caches per function shares these
+    instances between the copies it returns, so assigning to one would change
+    every copy. Use dataclasses.replace to get a modified instance.
+    """
 
     name: str
     type_hint: type
@@ -40,7 +49,7 @@ class ArgumentMetadata:
     default: Any = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FunctionMetadata:
     """Container for all parsed function metadata."""
 
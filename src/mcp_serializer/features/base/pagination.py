@@ -1,5 +1,6 @@
 from typing import List, Optional, Tuple, Any
 import base64
+import functools
 
 
 class Pagination:
@@ -13,16 +14,26 @@ class Pagination:
             raise ValueError("Page size must be greater than 0")
         self.size = size
 
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def for_size(cls, size: int) -> "Pagination":
+        """Return a shared Pagination for a page size.
+
+        Instances hold nothing but the size, so list requests can reuse one.
+        """
+        return cls(size)
+
     def _encode_cursor(self, index: int) -> str:
         """Encode index as base64 cursor."""
-        return base64.b64encode(str(index).encode()).decode()
+        return base64.b64encode(b"%d" % index).decode("ascii")
 
     def _decode_cursor(self, cursor: Optional[str]) -> int:
         """Decode base64 cursor to index."""
         if cursor is None:
             return 0
         try:
-            return int(base64.b64decode(cursor.encode()).decode())
+            # b64decode takes ASCII str and int() parses the decoded bytes
+            return int(base64.b64decode(cursor))
         except (ValueError, TypeError) as e:
             raise self.InvalidCursorError(f"Invalid cursor: {cursor}") from e
 
@@ -1,13 +1,69 @@
 from typing import get_type_hints, Union, BinaryIO
+import codecs
 import inspect
 import re
 import os
-import base64
+import stat
+import mmap
+import dataclasses
+import functools
+import weakref
+from types import MappingProxyType
+from .contents import MimeTypes
 from .definitions import FunctionMetadata, ArgumentMetadata, FileMetadata, ContentTypes
 
+try:
+    # Optional SIMD-accelerated base64 codec, API compatible with the stdlib
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
 
 DEFAULT_TYPE_HINT = str
 
+# Docstring patterns, compiled once at import
+# Start of the parameters section: Google/Sphinx headers or a NumPy underline
+_PARAM_SECTION_RE = re.compile(
+    r"^[ \t]*(?:(?P<google>Args:|Arguments:|Parameters:|Param:)|(?P<sphinx>:param)"
+    r"|(?P<numpy>Parameters[ \t]*\n[ \t]*-+[ \t]*$))",
+    re.MULTILINE,
+)
+_GOOGLE_SECTION_RE = re.compile(
+    r"(?:Args?|Arguments?|Parameters?):\s*\n(.*?)(?:\n\n|\n[A-Z]|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+_GOOGLE_PARAM_RE = re.compile(
+    r"^\s*(\w+)(?:\s*\([^)]+\))?\s*:\s*(.+?)(?=^\s*\w+\s*(?:\([^)]+\))?\s*:|$)",
+    re.MULTILINE | re.DOTALL,
+)
+_NUMPY_SECTION_RE = re.compile(
+    r"Parameters\s*\n\s*-+\s*\n(.*?)(?:\n+[A-Z][a-z]*\s*\n\s*-+|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+_NUMPY_PARAM_RE = re.compile(
+    r"^\s*(\w+)\s*:.*?\n(.*?)(?=^\s*\w+\s*:|$)",
+    re.MULTILINE | re.DOTALL,
+)
+_SPHINX_PARAM_RE = re.compile(
+    r":param\s+(\w+)\s*:\s*(.+?)(?=\n\s*:|\n\s*\n|\Z)", re.DOTALL
+)
+
+# Files at least this large are memory mapped rather than read into memory
+_MMAP_MIN_SIZE = 1024 * 1024
+
+# Read size for descriptors whose reported size is 0 (pipes, devices, procfs)
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Base64 input chunk size, a multiple of 3 so chunks encode without padding
+_B64_CHUNK_SIZE = 3 * 64 * 1024
+
+# Bytes checked for valid UTF-8 before decoding a whole text file
+_TEXT_PROBE_SIZE = 4096
+_utf8_decoder = codecs.getincrementaldecoder("utf-8")
+
+# Parsed metadata per function, dropped when the function is garbage collected
+_METADATA_CACHE = weakref.WeakKeyDictionary()
+
 
 class FunctionParser:
     """Parse function metadata including name, title, description, arguments, and return type."""
@@ -23,11 +79,41 @@ class FunctionParser:
         self._signature = None
         self._type_hints = None
 
+        cached_metadata = self._get_cached_metadata()
+        if cached_metadata is not None:
+            self.function_metadata = cached_metadata
+            return
+
         # Initialize metadata container
         self.function_metadata = FunctionMetadata()
 
         # Parse all components during initialization
         self._parse_components()
+        self._set_cached_metadata()
+
+    def _get_cached_metadata(self):
+        """Return a copy of previously parsed metadata for the function, if any."""
+        try:
+            metadata = _METADATA_CACHE.get(self.func)
+        except TypeError:
+            # Unhashable or non weak-referenceable callable
+            return None
+        if metadata is None:
+            return None
+        return dataclasses.replace(
+            metadata, arguments=list(metadata.arguments), function=self.func
+        )
+
+    def _set_cached_metadata(self):
+        try:
+            _METADATA_CACHE[self.func] = dataclasses.replace(
+                self.function_metadata,
+                arguments=list(self.function_metadata.arguments),
+                # A strong reference to the key would keep the entry alive
+                function=None,
+            )
+        except TypeError:
+            pass
 
     def _parse_components(self):
         """Parse all function components."""
@@ -38,7 +124,11 @@ class FunctionParser:
             # Handle cases where type hints can't be resolved
             self._type_hints = {}
 
-        self._parsed_docstring = self._parse_docstring_structure(self.func.__doc__)
+        # Parameter descriptions are only needed when there are parameters
+        has_params = any(name != "self" for name in self._signature.parameters)
+        self._parsed_docstring = self._parse_docstring_structure(
+            self.func.__doc__, parse_params=has_params
+        )
 
         # Set parsed properties in metadata
         self.function_metadata.function = self.func
@@ -68,21 +158,37 @@ class FunctionParser:
             )
             self.function_metadata.arguments.append(arg_metadata)
 
-    def _parse_docstring_structure(self, docstring):
+    def _parse_docstring_structure(self, docstring, parse_params=True):
         """Parse docstring into title, description, and parameters.
 
+        Args:
+            docstring: The docstring to parse
+            parse_params: Whether to parse the parameters section; when False
+                'params' is left empty
+
         Returns:
             dict with keys: 'title', 'description', 'params'
         """
+        title, description, params = self._parse_docstring_parts(
+            docstring, parse_params
+        )
+        return {"title": title, "description": description, "params": params}
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_docstring_parts(cls, docstring, parse_params=True):
+        """Parse docstring into a (title, description, params) tuple.
+
+        Results are cached per docstring, so params is a read-only mapping.
+        """
         if not docstring:
-            return {"title": None, "description": None, "params": {}}
+            return None, None, MappingProxyType({})
 
         # Split docstring into lines and clean up
         lines = docstring.strip().split("\n")
         lines = [line.rstrip() for line in lines]
 
         title = None
-        description_lines = []
         params = {}
 
         # Check if first line is title (followed by empty line or end)
@@ -96,98 +202,88 @@ class FunctionParser:
             start_idx = 0
 
         # Find where parameters section starts
-        param_start_idx = len(lines)
-        param_keywords = ["Args:", "Arguments:", "Parameters:", "Param:"]
-
-        for i in range(start_idx, len(lines)):
-            line = lines[i].strip()
-            if any(line.startswith(keyword) for keyword in param_keywords):
-                param_start_idx = i
-                break
-            # Check for Sphinx style parameters
-            if line.startswith(":param"):
-                param_start_idx = i
-                break
-            # Check for NumPy style parameters
-            if (
-                line == "Parameters"
-                and i + 1 < len(lines)
-                and re.match(r"^-+$", lines[i + 1].strip())
-            ):
-                param_start_idx = i
-                break
+        body = "\n".join(lines[start_idx:])
+        section_match = _PARAM_SECTION_RE.search(body)
+        if section_match:
+            description_text = body[: section_match.start()]
+            if parse_params:
+                params = cls._parse_docstring_params(
+                    body[section_match.start() :], style=section_match.lastgroup
+                )
+        else:
+            description_text = body
 
         # Extract description (everything between title and parameters)
-        for i in range(start_idx, param_start_idx):
-            line = lines[i].strip()
-            if line:  # Skip empty lines within description
-                description_lines.append(line)
-
+        description_lines = [
+            line.strip() for line in description_text.split("\n") if line.strip()
+        ]
         description = " ".join(description_lines) if description_lines else None
 
-        # Extract parameters from the parameters section
-        if param_start_idx < len(lines):
-            param_section = "\n".join(lines[param_start_idx:])
-            params = self._parse_docstring_params(param_section)
-
-        docstring_info = {"title": title, "description": description, "params": params}
-        return docstring_info
+        return title, description, MappingProxyType(params)
 
-    def _parse_docstring_params(self, docstring):
+    @classmethod
+    def _parse_docstring_params(cls, docstring, style=None):
         """Parse parameter descriptions from docstring.
         Supports Google, NumPy, and Sphinx style docstrings.
+
+        Args:
+            docstring: The parameters section of the docstring
+            style: 'google', 'numpy' or 'sphinx' to parse only that style;
+                None tries all of them
         """
         if not docstring:
             return {}
 
+        if style is not None:
+            return cls._STYLE_PARSERS[style](docstring)
+
         param_descriptions = {}
+        param_descriptions.update(cls._parse_google_params(docstring))
+        param_descriptions.update(cls._parse_numpy_params(docstring))
+        param_descriptions.update(cls._parse_sphinx_params(docstring))
+        return param_descriptions
 
-        # Google style: Args: or Parameters:
-        google_match = re.search(
-            r"(?:Args?|Arguments?|Parameters?):\s*\n(.*?)(?:\n\n|\n[A-Z]|\Z)",
-            docstring,
-            re.DOTALL | re.IGNORECASE,
-        )
+    @staticmethod
+    def _parse_google_params(docstring):
+        """Google style: Args: or Parameters:"""
+        param_descriptions = {}
+        google_match = _GOOGLE_SECTION_RE.search(docstring)
         if google_match:
             params_section = google_match.group(1)
             # Match param_name: description or param_name (type): description
-            for match in re.finditer(
-                r"^\s*(\w+)(?:\s*\([^)]+\))?\s*:\s*(.+?)(?=^\s*\w+\s*(?:\([^)]+\))?\s*:|$)",
-                params_section,
-                re.MULTILINE | re.DOTALL,
-            ):
+            for match in _GOOGLE_PARAM_RE.finditer(params_section):
                 param_name = match.group(1).strip()
-                description = re.sub(r"\s+", " ", match.group(2).strip())
+                description = " ".join(match.group(2).split())
                 param_descriptions[param_name] = description
+        return param_descriptions
 
-        # NumPy style: Parameters followed by dashes
-        numpy_match = re.search(
-            r"Parameters\s*\n\s*-+\s*\n(.*?)(?:\n+[A-Z][a-z]*\s*\n\s*-+|\Z)",
-            docstring,
-            re.DOTALL | re.IGNORECASE,
-        )
+    @staticmethod
+    def _parse_numpy_params(docstring):
+        """NumPy style: Parameters followed by dashes"""
+        param_descriptions = {}
+        numpy_match = _NUMPY_SECTION_RE.search(docstring)
         if numpy_match:
             params_section = numpy_match.group(1)
             # Match param_name : type and description on next lines
-            for match in re.finditer(
-                r"^\s*(\w+)\s*:.*?\n(.*?)(?=^\s*\w+\s*:|$)",
-                params_section,
-                re.MULTILINE | re.DOTALL,
-            ):
+            for match in _NUMPY_PARAM_RE.finditer(params_section):
                 param_name = match.group(1).strip()
-                description = re.sub(r"\s+", " ", match.group(2).strip())
+                description = " ".join(match.group(2).split())
                 param_descriptions[param_name] = description
+        return param_descriptions
 
-        # Sphinx style: :param param_name: description
-        sphinx_matches = re.findall(
-            r":param\s+(\w+)\s*:\s*(.+?)(?=\n\s*:|\n\s*\n|\Z)", docstring, re.DOTALL
-        )
-        for param_name, description in sphinx_matches:
-            param_descriptions[param_name.strip()] = re.sub(
-                r"\s+", " ", description.strip()
-            )
+    @staticmethod
+    def _parse_sphinx_params(docstring):
+        """Sphinx style: :param param_name: description"""
+        return {
+            param_name.strip(): " ".join(description.split())
+            for param_name, description in _SPHINX_PARAM_RE.findall(docstring)
+        }
 
-        return param_descriptions
+    _STYLE_PARSERS = {
+        "google": _parse_google_params.__func__,
+        "numpy": _parse_numpy_params.__func__,
+        "sphinx": _parse_sphinx_params.__func__,
+    }
 
 
 class FileParser:
@@ -211,28 +307,75 @@ class FileParser:
         # Read file content
         file_name, size, file_content, uri = self._read_file(self.file)
 
-        # Try as text content
-        metadata = self._try_as_text_content(file_name, size, file_content, uri)
-        if metadata:
-            return metadata
-
-        # Try as image content
-        metadata = self._try_as_image_content(file_name, size, file_content, uri)
-        if metadata:
-            return metadata
-
-        # Try as audio content
-        metadata = self._try_as_audio_content(file_name, size, file_content, uri)
-        if metadata:
-            return metadata
+        try:
+            # Try each content type the extension maps to, text first
+            for content_type, mime_type in MimeTypes.get_content_candidates(
+                file_name
+            ):
+                if content_type == ContentTypes.TEXT:
+                    metadata = self._try_as_text_content(
+                        mime_type, file_name, size, file_content, uri
+                    )
+                else:
+                    metadata = self._try_as_binary_content(
+                        mime_type, content_type, file_name, size, file_content, uri
+                    )
+                if metadata:
+                    return metadata
+        finally:
+            if isinstance(file_content, mmap.mmap):
+                file_content.close()
 
         raise ValueError(
             f"Cannot determine file type from MimeTypes for file: {file_name}"
         )
 
+    @staticmethod
+    def _b64encode(file_content) -> str:
+        """Base64 encode file content to an ASCII string.
+
+        Large (memory mapped) content is encoded in chunks whose size is a
+        multiple of 3, so no padding appears between chunks and only one chunk
+        of the mapping is touched at a time.
+        """
+        if isinstance(file_content, str):
+            file_content = file_content.encode("utf-8")
+        if len(file_content) <= _B64_CHUNK_SIZE:
+            return _b64.b64encode(file_content).decode("ascii")
+
+        view = memoryview(file_content)
+        try:
+            return "".join(
+                _b64.b64encode(view[start : start + _B64_CHUNK_SIZE]).decode("ascii")
+                for start in range(0, len(view), _B64_CHUNK_SIZE)
+            )
+        finally:
+            # Release the export so the mmap can be closed
+            view.release()
+
+    @staticmethod
+    def _read_fd(fd: int, size: int) -> bytes:
+        """Read a raw file descriptor until EOF, starting with size bytes."""
+        read_size = size or _READ_CHUNK_SIZE
+        data = os.read(fd, read_size)
+        if not data:
+            return data
+        # The reported size may be 0 or stale, so only an empty read means EOF
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, read_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks) if len(chunks) > 1 else data
+
     def _read_file(self, file: Union[str, BinaryIO]) -> tuple[str, int, bytes, str]:
         """Read file and extract file name, size, content, and URI.
 
+        Small files and non-regular files are read with unbuffered os.read
+        calls. Larger regular files are memory mapped instead of copied into a
+        bytes object; the caller is responsible for closing a returned mmap.
+
         Args:
             file: The file path (str) or file object (BinaryIO)
 
@@ -241,10 +384,18 @@ class FileParser:
         """
         if isinstance(file, str):
             file_name = os.path.basename(file)
-            size = os.path.getsize(file)
             uri = f"file://{os.path.abspath(file)}"
-            with open(file, "rb") as f:
-                file_content = f.read()
+            fd = os.open(file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                st = os.fstat(fd)
+                size = st.st_size
+                if stat.S_ISREG(st.st_mode) and size >= _MMAP_MIN_SIZE:
+                    file_content = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                else:
+                    file_content = self._read_fd(fd, size)
+                    size = len(file_content)
+            finally:
+                os.close(fd)
         else:
             # Handle file-like objects (may be opened or closed)
             file_path = getattr(file, "name", "unknown")
@@ -283,9 +434,6 @@ class FileParser:
                     file.seek(current_pos)
                 except (ValueError, AttributeError):
                     pass
-
-                if isinstance(file_content, str):
-                    file_content = file_content.encode("utf-8")
             finally:
                 # Close file if we opened it
                 if should_close and hasattr(file, "close"):
@@ -294,94 +442,70 @@ class FileParser:
         return file_name, size, file_content, uri
 
     def _try_as_text_content(
-        self, file_name: str, size: int, file_content: bytes, uri: str
+        self, mime_type, file_name: str, size: int, file_content: bytes, uri: str
     ) -> Union[FileMetadata, None]:
         """Try to process file as text content.
 
         Args:
+            mime_type: Text mime type for the file's extension
             file_name: Name of the file
             size: Size of the file in bytes
-            file_content: Raw file content as bytes
-            uri: URI of the file
-
-        Returns:
-            FileMetadata if successful, None otherwise
-        """
-        from .contents import MimeTypes
-
-        mime_type = MimeTypes.Text.from_file_name(file_name)
-        if mime_type:
-            try:
-                data = file_content.decode("utf-8")
-                return FileMetadata(
-                    size=size,
-                    name=file_name,
-                    mime_type=mime_type,
-                    data=data,
-                    content_type=ContentTypes.TEXT,
-                    uri=uri,
-                )
-            except UnicodeDecodeError:
-                # If it can't be decoded as UTF-8, it's not text
-                pass
-        return None
-
-    def _try_as_image_content(
-        self, file_name: str, size: int, file_content: bytes, uri: str
-    ) -> Union[FileMetadata, None]:
-        """Try to process file as image content.
-
-        Args:
-            file_name: Name of the file
-            size: Size of the file in bytes
-            file_content: Raw file content as bytes
+            file_content: Raw file content as bytes, or str when read from a
+                text mode file object
             uri: URI of the file
 
         Returns:
             FileMetadata if successful, None otherwise
         """
-        from .contents import MimeTypes
-
-        mime_type = MimeTypes.Image.from_file_name(file_name)
-        if mime_type:
-            data = base64.b64encode(file_content).decode("utf-8")
-            return FileMetadata(
-                file_name=file_name,
-                size=size,
-                name=file_name,
-                mime_type=mime_type,
-                data=data,
-                content_type=ContentTypes.IMAGE,
-                uri=uri,
-            )
-        return None
+        try:
+            # Text mode file objects already hand back a str
+            if isinstance(file_content, str):
+                data = file_content
+            else:
+                if len(file_content) > _TEXT_PROBE_SIZE:
+                    # Fail fast on binary content before decoding it all,
+                    # the incremental decoder tolerates a split final char
+                    _utf8_decoder().decode(file_content[:_TEXT_PROBE_SIZE])
+                data = str(file_content, "utf-8")
+        except UnicodeDecodeError:
+            # If it can't be decoded as UTF-8, it's not text
+            return None
+        return FileMetadata(
+            size=size,
+            name=file_name,
+            mime_type=mime_type,
+            data=data,
+            content_type=ContentTypes.TEXT,
+            uri=uri,
+        )
 
-    def _try_as_audio_content(
-        self, file_name: str, size: int, file_content: bytes, uri: str
+    def _try_as_binary_content(
+        self,
+        mime_type,
+        content_type: str,
+        file_name: str,
+        size: int,
+        file_content: bytes,
+        uri: str,
     ) -> Union[FileMetadata, None]:
-        """Try to process file as audio content.
+        """Process file as base64 encoded binary content.
 
         Args:
+            mime_type: Image or audio mime type for the file's extension
+            content_type: ContentTypes value for the resulting metadata
             file_name: Name of the file
             size: Size of the file in bytes
             file_content: Raw file content as bytes
             uri: URI of the file
 
         Returns:
-            FileMetadata if successful, None otherwise
+            FileMetadata with the encoded content
         """
-        from .contents import MimeTypes
-
-        mime_type = MimeTypes.Audio.from_file_name(file_name)
-        if mime_type:
-            data = base64.b64encode(file_content).decode("utf-8")
-            return FileMetadata(
-                file_name=file_name,
-                size=size,
-                name=file_name,
-                mime_type=mime_type,
-                data=data,
-                content_type=ContentTypes.AUDIO,
-                uri=uri,
-            )
-        return None
+        return FileMetadata(
+            size=size,
+            name=file_name,
+            mime_type=mime_type,
+            data=self._b64encode(file_content),
+            content_type=content_type,
+            uri=uri,
+        )
@@ -1,13 +1,42 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import Optional, get_origin, get_args, Union, Any
 from enum import Enum
 from decimal import Decimal
 from datetime import datetime, date, time, timedelta
 from uuid import UUID
 from pathlib import Path
+import functools
+import types
 import typing
 import json
 
+from .contents import is_base64
+
+
+_TRUE_STRINGS = frozenset(("true", "1", "yes", "on"))
+_FALSE_STRINGS = frozenset(("false", "0", "no", "off"))
+
+
+def _cast_bool(value):
+    if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        elif lowered in _FALSE_STRINGS:
+            return False
+    return bool(value)
+
+
+# Plain types cast with a single call, looked up before any generic handling
+_BASIC_TYPE_CASTERS = {
+    str: str,
+    int: int,
+    float: float,
+    bool: _cast_bool,
+    complex: complex,
+    Decimal: lambda value: Decimal(str(value)),
+}
+
 
 def cast_python_type(value, python_type):
     """
@@ -25,9 +54,18 @@ def cast_python_type(value, python_type):
         return None
 
     # If already the correct type, return as-is
-    if type(value) == python_type:
+    if type(value) is python_type:
         return value
 
+    # Handle basic Python types
+    try:
+        caster = _BASIC_TYPE_CASTERS.get(python_type)
+    except TypeError:
+        # Unhashable type annotation
+        caster = None
+    if caster is not None:
+        return caster(value)
+
     # Get origin and args for generic types
     origin = get_origin(python_type)
     args = get_args(python_type)
@@ -147,21 +185,6 @@ def cast_python_type(value, python_type):
         else:
             raise ValueError(f"Cannot cast {value} to tuple")
 
-    # Handle basic Python types
-    if python_type is str:
-        return str(value)
-    if python_type is int:
-        return int(value)
-    if python_type is float:
-        return float(value)
-    if python_type is bool:
-        if isinstance(value, str):
-            if value.lower() in ("true", "1", "yes", "on"):
-                return True
-            elif value.lower() in ("false", "0", "no", "off"):
-                return False
-        return bool(value)
-
     # Handle tuple, set, frozenset without type params
     if python_type in (tuple, set, frozenset):
         if isinstance(value, str):
@@ -182,12 +205,6 @@ def cast_python_type(value, python_type):
             return python_type(base64.b64decode(value))
         return python_type(value)
 
-    # Handle numeric types
-    if python_type is Decimal:
-        return Decimal(str(value))
-    if python_type is complex:
-        return complex(value)
-
     # Handle date/time types
     if python_type is datetime:
         if isinstance(value, str):
@@ -245,6 +262,35 @@ def cast_python_type(value, python_type):
         raise ValueError(f"Cannot cast {value} to {python_type}")
 
 
+# JSON schemas for types that need no introspection, copied on use
+_BASIC_TYPE_SCHEMAS = {
+    None: {"type": "null"},
+    type(None): {"type": "null"},
+    Any: {},  # Empty schema accepts anything
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    list: {"type": "array"},
+    dict: {"type": "object"},
+    tuple: {"type": "array"},
+    set: {"type": "array"},
+    frozenset: {"type": "array"},
+    # bytes as string (base64 encoded)
+    bytes: {"type": "string", "contentEncoding": "base64"},
+    bytearray: {"type": "string", "contentEncoding": "base64"},
+    Decimal: {"type": "number"},
+    complex: {"type": "string"},
+    # date/time types and UUID as string with format
+    datetime: {"type": "string", "format": "date-time"},
+    date: {"type": "string", "format": "date"},
+    time: {"type": "string", "format": "time"},
+    timedelta: {"type": "string"},
+    UUID: {"type": "string", "format": "uuid"},
+    Path: {"type": "string"},
+}
+
+
 class JsonSchema(BaseModel):
     type: str = "object"
     properties: dict = {}
@@ -294,155 +340,159 @@ class JsonSchema(BaseModel):
 
         Handles nested types like List[str], Dict[str, int], Optional[X], etc.
         """
-        # Handle None type
-        if python_type is None or python_type is type(None):
-            return {"type": "null"}
-
-        # Handle typing.Any
-        if python_type is Any:
-            return {}  # Empty schema accepts anything
-
-        # Get the origin type for generic types
-        origin = get_origin(python_type)
-        args = get_args(python_type)
-
-        # Handle Optional[X] which is Union[X, None]
-        if origin is Union:
-            non_none_args = [arg for arg in args if arg is not type(None)]
-            if len(non_none_args) == 1:
-                # Optional[X] - return schema for X
-                return self._python_type_to_json_schema(non_none_args[0])
-            elif len(non_none_args) == 0:
-                return {"type": "null"}
-            else:
-                # Union of multiple types - use anyOf
-                return {
-                    "anyOf": [
-                        self._python_type_to_json_schema(arg) for arg in non_none_args
-                    ]
-                }
-
-        # Handle List[X], list[X]
-        if origin in (list,) or (
-            hasattr(typing, "List") and origin is getattr(typing, "List", None)
-        ):
-            schema = {"type": "array"}
-            if args:
-                schema["items"] = self._python_type_to_json_schema(args[0])
-            return schema
-
-        # Handle Dict[K, V], dict[K, V]
-        if origin in (dict,) or (
-            hasattr(typing, "Dict") and origin is getattr(typing, "Dict", None)
-        ):
-            schema = {"type": "object"}
-            if args and len(args) >= 2:
-                # additionalProperties describes the value type
-                schema["additionalProperties"] = self._python_type_to_json_schema(
-                    args[1]
-                )
-            return schema
-
-        # Handle Set[X], set[X], FrozenSet[X]
-        if (
-            origin in (set, frozenset)
-            or origin is getattr(typing, "Set", None)
-            or origin is getattr(typing, "FrozenSet", None)
-        ):
-            schema = {"type": "array", "uniqueItems": True}
-            if args:
-                schema["items"] = self._python_type_to_json_schema(args[0])
-            return schema
+        return _copy_schema(_json_schema_for(python_type))
+
+
+def _copy_schema(schema):
+    """Copy the dicts and lists of a schema so the cached one stays intact."""
+    if isinstance(schema, dict):
+        return {key: _copy_schema(value) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_copy_schema(item) for item in schema]
+    return schema
+
+
+def _union_schema(args) -> dict:
+    non_none_args = [arg for arg in args if arg is not type(None)]
+    if len(non_none_args) == 1:
+        # Optional[X] - return schema for X
+        return _json_schema_for(non_none_args[0])
+    elif len(non_none_args) == 0:
+        return {"type": "null"}
+    else:
+        # Union of multiple types - use anyOf
+        return {"anyOf": [_json_schema_for(arg) for arg in non_none_args]}
+
+
+def _list_schema(args) -> dict:
+    schema = {"type": "array"}
+    if args:
+        schema["items"] = _json_schema_for(args[0])
+    return schema
+
+
+def _dict_schema(args) -> dict:
+    schema = {"type": "object"}
+    if args and len(args) >= 2:
+        # additionalProperties describes the value type
+        schema["additionalProperties"] = _json_schema_for(args[1])
+    return schema
+
+
+def _set_schema(args) -> dict:
+    schema = {"type": "array", "uniqueItems": True}
+    if args:
+        schema["items"] = _json_schema_for(args[0])
+    return schema
+
+
+def _tuple_schema(args) -> dict:
+    schema = {"type": "array"}
+    if args:
+        # Check if it's Tuple[X, ...] (variable length)
+        if len(args) == 2 and args[1] is Ellipsis:
+            schema["items"] = _json_schema_for(args[0])
+        else:
+            # Fixed length tuple with items
+            schema["items"] = [_json_schema_for(arg) for arg in args]
+            schema["minItems"] = len(args)
+            schema["maxItems"] = len(args)
+    return schema
+
+
+# get_origin normalizes typing aliases (List[X], Dict[K, V], ...) to builtins
+_ORIGIN_SCHEMA_HANDLERS = {
+    Union: _union_schema,
+    list: _list_schema,
+    dict: _dict_schema,
+    set: _set_schema,
+    frozenset: _set_schema,
+    tuple: _tuple_schema,
+}
+if hasattr(types, "UnionType"):
+    # X | Y unions (Python 3.10+) compare equal to Union[X, Y], so they must
+    # produce the same schema or the cache would depend on lookup order
+    _ORIGIN_SCHEMA_HANDLERS[types.UnionType] = _union_schema
+
+
+def _json_schema_for(python_type) -> dict:
+    """Return the shared, cached schema for a type; callers must not mutate it."""
+    try:
+        # Unions compare equal regardless of member order (and so do generics
+        # containing them), but anyOf keeps that order; the repr tells them apart
+        return _cached_json_schema(python_type, repr(python_type))
+    except TypeError:
+        # Unhashable type annotation
+        return _build_json_schema(python_type)
 
-        # Handle Tuple[X, Y, ...]
-        if origin in (tuple,) or origin is getattr(typing, "Tuple", None):
-            schema = {"type": "array"}
-            if args:
-                # Check if it's Tuple[X, ...] (variable length)
-                if len(args) == 2 and args[1] is Ellipsis:
-                    schema["items"] = self._python_type_to_json_schema(args[0])
-                else:
-                    # Fixed length tuple with items
-                    schema["items"] = [
-                        self._python_type_to_json_schema(arg) for arg in args
-                    ]
-                    schema["minItems"] = len(args)
-                    schema["maxItems"] = len(args)
-            return schema
-
-        # Handle basic Python types
-        if python_type is str:
-            return {"type": "string"}
-        if python_type is int:
-            return {"type": "integer"}
-        if python_type is float:
-            return {"type": "number"}
-        if python_type is bool:
-            return {"type": "boolean"}
-        if python_type is list:
-            return {"type": "array"}
-        if python_type is dict:
-            return {"type": "object"}
-
-        # Handle tuple, set, frozenset without type params
-        if python_type in (tuple, set, frozenset):
-            return {"type": "array"}
-
-        # Handle bytes as string (base64 encoded)
-        if python_type in (bytes, bytearray):
-            return {"type": "string", "contentEncoding": "base64"}
-
-        # Handle numeric types
-        if python_type is Decimal:
-            return {"type": "number"}
-        if python_type is complex:
-            return {"type": "string"}
-
-        # Handle date/time types as string with format
-        if python_type is datetime:
-            return {"type": "string", "format": "date-time"}
-        if python_type is date:
-            return {"type": "string", "format": "date"}
-        if python_type is time:
-            return {"type": "string", "format": "time"}
-        if python_type is timedelta:
-            return {"type": "string"}
-
-        # Handle UUID as string with format
-        if python_type is UUID:
-            return {"type": "string", "format": "uuid"}
-
-        # Handle Path as string
-        if python_type is Path or (
-            isinstance(python_type, type) and issubclass(python_type, Path)
-        ):
-            return {"type": "string"}
-
-        # Handle Enum types - use enum values
-        if isinstance(python_type, type) and issubclass(python_type, Enum):
-            enum_values = [e.value for e in python_type]
-            # Determine type from first value
-            if enum_values:
-                first_val = enum_values[0]
-                if isinstance(first_val, str):
-                    return {"type": "string", "enum": enum_values}
-                elif isinstance(first_val, int):
-                    return {"type": "integer", "enum": enum_values}
-                elif isinstance(first_val, float):
-                    return {"type": "number", "enum": enum_values}
-            return {"type": "string", "enum": enum_values}
-
-        # Handle Pydantic BaseModel - convert to object schema
-        if isinstance(python_type, type) and issubclass(python_type, BaseModel):
-            return python_type.model_json_schema()
-
-        # Handle any other class type as object
-        if isinstance(python_type, type):
-            return {"type": "object"}
-
-        # Handle string type hints (forward references)
-        if isinstance(python_type, str):
-            return {"type": "object"}
-
-        # Default: return empty schema (accepts anything)
-        return {}
+
+def _build_json_schema(python_type) -> dict:
+    """
+    Convert a Python type to a JSON Schema definition dict.
+
+    Nested schemas come from the cache and are shared, see _json_schema_for.
+    """
+    # Handle None, Any and plain types with a fixed schema
+    try:
+        basic_schema = _BASIC_TYPE_SCHEMAS.get(python_type)
+    except TypeError:
+        # Unhashable type annotation
+        basic_schema = None
+    if basic_schema is not None:
+        return basic_schema
+
+    # Handle generic types (Optional/Union, List, Dict, Set, Tuple) by origin
+    origin = get_origin(python_type)
+    if origin is not None:
+        origin_handler = _ORIGIN_SCHEMA_HANDLERS.get(origin)
+        if origin_handler is not None:
+            return origin_handler(get_args(python_type))
+
+    # Handle Path subclasses as string
+    if isinstance(python_type, type) and issubclass(python_type, Path):
+        return {"type": "string"}
+
+    # Handle Enum types - use enum values
+    if isinstance(python_type, type) and issubclass(python_type, Enum):
+        enum_values = [e.value for e in python_type]
+        # Determine type from first value
+        if enum_values:
+            first_val = enum_values[0]
+            if isinstance(first_val, str):
+                return {"type": "string", "enum": enum_values}
+            elif isinstance(first_val, int):
+                return {"type": "integer", "enum": enum_values}
+            elif isinstance(first_val, float):
+                return {"type": "number", "enum": enum_values}
+        return {"type": "string", "enum": enum_values}
+
+    # Handle Pydantic BaseModel - convert to object schema
+    if isinstance(python_type, type) and issubclass(python_type, BaseModel):
+        return python_type.model_json_schema()
+
+    # Handle any other class type as object
+    if isinstance(python_type, type):
+        return {"type": "object"}
+
+    # Handle string type hints (forward references)
+    if isinstance(python_type, str):
+        return {"type": "object"}
+
+    # Default: return empty schema (accepts anything)
+    return {}
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_json_schema(python_type, type_repr) -> dict:
+    return _build_json_schema(python_type)
+
+
+class Base64DataModel(BaseModel):
+    """Base for content models whose data field holds base64 encoded bytes."""
+
+    @field_validator("data", check_fields=False)
+    @classmethod
+    def validate_base64_data(cls, v):
+        if not is_base64(v):
+            raise ValueError("Data must be valid base64 encoded string")
+        return v
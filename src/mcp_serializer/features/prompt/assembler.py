@@ -1,6 +1,5 @@
 from typing import Optional
 from .schema import (
-    ArgumentSchema,
     PromptDefinitionSchema,
     PromptsListSchema,
     PromptResultSchema,
@@ -49,22 +48,21 @@ class PromptsSchemaAssembler(FeatureSchemaAssembler):
         if not metadata.arguments:
             return None
 
-        arguments = []
-        for arg in metadata.arguments:
-            arg_schema = ArgumentSchema(
-                name=arg.name,
-                description=arg.description,
-                required=arg.required,
-            )
-            arguments.append(arg_schema.model_dump())
-
-        return arguments
+        # Same shape as ArgumentSchema.model_dump(), without the model round trip
+        return [
+            {
+                "name": arg.name,
+                "description": arg.description,
+                "required": arg.required,
+            }
+            for arg in metadata.arguments
+        ]
 
     def build_list_result_schema(
         self, page_size: int = 10, cursor: Optional[str] = None
     ):
         """Build the list result schema for prompts."""
-        pagination = Pagination(page_size)
+        pagination = Pagination.for_size(page_size)
         paginated_prompts, next_cursor = pagination.paginate(self.prompts_list, cursor)
         return PromptsListSchema(
             prompts=paginated_prompts, nextCursor=next_cursor
@@ -5,6 +5,8 @@ from .result import PromptsResult
 
 
 class ResultRegistry:
+    __slots__ = ("result", "name", "extra")
+
     def __init__(self, result: PromptsResult, name: str, extra: dict = None):
         self.result = result
         self.name = name
@@ -12,6 +14,8 @@ class ResultRegistry:
 
 
 class PromptRegistry:
+    __slots__ = ("metadata", "extra")
+
     def __init__(self, metadata: FunctionMetadata, extra: dict = None):
         self.metadata = metadata
         self.extra = extra or {}
@@ -1,6 +1,7 @@
 import base64
 from typing import Optional, Dict, Any, List, Union
 from enum import Enum
+from pydantic import BaseModel
 
 from ..base.parsers import FileParser
 from ..base.definitions import ContentTypes
@@ -9,7 +10,6 @@ from .schema import (
     ImageContent,
     AudioContent,
     EmbeddedResource,
-    PromptMessageSchema,
 )
 from ..resource.schema import TextContentSchema, BinaryContentSchema
 
@@ -21,7 +21,8 @@ class PromptsResult:
 
         @classmethod
         def has_value(cls, value):
-            return any(item.value == value for item in cls)
+            # Role values are strings; anything else, hashable or not, is no role
+            return isinstance(value, str) and value in _ROLE_VALUES
 
     class ResourceNotFoundError(Exception):
         pass
@@ -58,10 +59,15 @@ class PromptsResult:
         if not content:
             raise ValueError("Content is required for message")
 
-        content = content.model_dump() if hasattr(content, "model_dump") else content
+        if isinstance(content, BaseModel):
+            content = content.model_dump()
+        if not isinstance(content, dict):
+            raise ValueError("Message content must be a dict")
 
-        message = PromptMessageSchema(role=role, content=content)
-        self.messages.append(message.model_dump())
+        # role is checked above and content is already a dumped dict, so the
+        # message is stored as is without another validate/dump round trip
+        message = {"role": role, "content": content}
+        self.messages.append(message)
         return message
 
     def add_text(
@@ -223,36 +229,39 @@ class PromptsResult:
 
         resource_content = {}
         if self.resource_container:
-            try:
-                resource_result = self.resource_container.call(uri)
-                resource_content = resource_result["contents"][0]
-            except Exception:
-                if not text and not blob:
-                    raise self.ResourceNotFoundError(
-                        f"Resource with URI '{uri}' is not found. Either provide text or blob data with mime type."
-                    )
+            if self.resource_container.has_uri(uri):
+                contents = self.resource_container.call(uri)["contents"]
+                if contents:
+                    resource_content = contents[0]
+            if not resource_content and not text and not blob:
+                raise self.ResourceNotFoundError(
+                    f"Resource with URI '{uri}' is not found. Either provide text or blob data with mime type."
+                )
         else:
             if not text and not blob:
                 raise self.ResourceContainerRequiredError(
                     "Use ResourceContainer to initialize PromptsResult when only URI is provided for embedded resource"
                 )
 
-        text = text or resource_content.get("text")
-        blob = blob or resource_content.get("blob")
-        mime_type = mime_type or resource_content.get("mimeType")
+        content_data = {
+            "uri": uri,
+            "name": name,
+            "title": title,
+            "annotations": annotations,
+        }
+        if resource_content:
+            # arguments given by the caller take precedence over the resource
+            text = text or resource_content.get("text")
+            blob = blob or resource_content.get("blob")
+            mime_type = mime_type or resource_content.get("mimeType")
+            for key in ("name", "title", "annotations"):
+                content_data[key] = content_data[key] or resource_content.get(key)
 
         if not mime_type:
             raise ValueError(
                 f"Could not determine mime type for embedded resource of uri: {uri}. Provide mime type manually."
             )
-
-        content_data = {
-            "uri": uri,
-            "mimeType": mime_type,
-            "name": name or resource_content.get("name"),
-            "title": title or resource_content.get("title"),
-            "annotations": annotations or resource_content.get("annotations"),
-        }
+        content_data["mimeType"] = mime_type
 
         if text:
             resource_schema = TextContentSchema(
@@ -269,6 +278,11 @@ class PromptsResult:
                 "Either 'text' or 'blob' must be provided for embedded resource"
             )
 
-        embedded_resource = EmbeddedResource(resource=resource_schema)
+        # resource_schema was validated when it was built just above
+        embedded_resource = EmbeddedResource.model_construct(resource=resource_schema)
         self._add_message(role, embedded_resource.model_dump())
         return embedded_resource
+
+
+# Role values, checked with a single set lookup
+_ROLE_VALUES = frozenset(role.value for role in PromptsResult.Roles)
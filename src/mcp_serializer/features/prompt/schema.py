@@ -1,7 +1,7 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel
 from typing import Optional, Dict, Any, List, Union
+from ..base.schema import Base64DataModel
 from ..resource.schema import TextContentSchema, BinaryContentSchema
-import base64
 
 
 class ArgumentSchema(BaseModel):
@@ -30,55 +30,25 @@ class TextContent(BaseModel):
     annotations: Optional[Dict[str, Any]] = None
 
 
-class ImageContent(BaseModel):
+class ImageContent(Base64DataModel):
     type: str = "image"
     data: str
     mimeType: str
     annotations: Optional[Dict[str, Any]] = None
 
-    @field_validator("data")
-    @classmethod
-    def validate_base64_data(cls, v):
-        try:
-            base64.b64decode(v, validate=True)
-        except Exception:
-            raise ValueError("Data must be valid base64 encoded string")
-        return v
 
-
-class AudioContent(BaseModel):
+class AudioContent(Base64DataModel):
     type: str = "audio"
     data: str
     mimeType: str
     annotations: Optional[Dict[str, Any]] = None
 
-    @field_validator("data")
-    @classmethod
-    def validate_base64_data(cls, v):
-        try:
-            base64.b64decode(v, validate=True)
-        except Exception:
-            raise ValueError("Data must be valid base64 encoded string")
-        return v
-
 
 class EmbeddedResource(BaseModel):
     type: str = "resource"
     resource: Union[TextContentSchema, BinaryContentSchema]
 
 
-class PromptMessageSchema(BaseModel):
-    role: str
-    content: dict
-
-    @field_validator("role")
-    @classmethod
-    def validate_role(cls, v):
-        if v not in ["user", "assistant"]:
-            raise ValueError("Role must be either 'user' or 'assistant'")
-        return v
-
-
 class PromptResultSchema(BaseModel):
     description: Optional[str] = None
     messages: List[dict]
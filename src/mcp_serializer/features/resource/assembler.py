@@ -1,12 +1,9 @@
 from typing import Optional
 
-from .schema import (
-    ResourceListResultSchema,
-    ResourceTemplateListResultSchema,
-    ResourceDefinitionSchema,
-)
+from .schema import ResourceDefinitionSchema
+from .registries import FunctionRegistry, _UriTrie
 from .result import ResourceResult
-from .schema import ResultSchema
+from .schema import AnnotationSchema
 from ..base.assembler import FeatureSchemaAssembler
 from ..base.pagination import Pagination
 
@@ -15,10 +12,14 @@ class ResourceSchemaAssembler(FeatureSchemaAssembler):
     def __init__(self):
         self.resource_list = []
         self.resource_template_list = []
+        # uri without trailing slash -> resource registry, for exact lookups
+        self._resources_by_uri = {}
+        # template uri -> registry; the trie finds the longest matching prefix
+        self._templates_by_uri = {}
+        self._template_trie = _UriTrie()
 
     def add_resource_registry(self, resource_registry):
-        from .container import FunctionRegistry
-
+        uri = resource_registry.uri
         if (
             isinstance(resource_registry, FunctionRegistry)
             and resource_registry.metadata.has_arguments
@@ -26,48 +27,33 @@ class ResourceSchemaAssembler(FeatureSchemaAssembler):
             self._append_sorted_list(
                 self.resource_template_list, resource_registry, "uri"
             )
+            self._templates_by_uri.setdefault(uri, resource_registry)
+            self._template_trie.add(uri)
         else:
             self._append_sorted_list(self.resource_list, resource_registry, "uri")
-
-    def _build_function_uri(self, function_registry):
-        uri = function_registry.uri
-        for argument in function_registry.metadata.arguments:
-            if argument.required:
-                uri += "/{" + argument.name + "}"
-        return uri
+            self._resources_by_uri.setdefault(uri.rstrip("/"), resource_registry)
+
+    def get_resource_registry(self, uri: str):
+        """Return the registry listed for uri, or None.
+
+        Resources match on the uri ignoring a trailing slash; otherwise the
+        template with the longest uri that uri starts with is returned.
+        """
+        registry = self._resources_by_uri.get(uri.rstrip("/"))
+        if registry is not None:
+            return registry
+        template_uri = self._template_trie.longest_prefix(uri)
+        if template_uri is None:
+            return None
+        return self._templates_by_uri[template_uri]
 
     def _build_definition_schema(self, resource_registry_list):
-        from .container import FunctionRegistry
-
         resource_schema_list = []
         for resource_registry in resource_registry_list:
-            definition_kwargs = {}
-            if isinstance(resource_registry, FunctionRegistry):
-                metadata = resource_registry.metadata
-                definition_kwargs = {
-                    "uri": self._build_function_uri(resource_registry),
-                    "name": resource_registry.extra.get("name") or metadata.name,
-                    "title": resource_registry.extra.get("title") or metadata.title,
-                    "description": resource_registry.extra.get("description")
-                    or metadata.description,
-                    "mimeType": resource_registry.extra.get("mime_type"),
-                    "size": resource_registry.extra.get("size"),
-                    "annotations": self._remove_none_from_dict(
-                        resource_registry.extra.get("annotations")
-                    ),
-                }
-            else:
-                definition_kwargs = {
-                    "uri": resource_registry.uri,
-                    "name": resource_registry.extra.get("name"),
-                    "title": resource_registry.extra.get("title"),
-                    "description": resource_registry.extra.get("description"),
-                    "mimeType": resource_registry.extra.get("mime_type"),
-                    "size": resource_registry.extra.get("size"),
-                    "annotations": self._remove_none_from_dict(
-                        resource_registry.extra.get("annotations")
-                    ),
-                }
+            definition_kwargs = dict(resource_registry.definition_kwargs)
+            definition_kwargs["annotations"] = self._remove_none_from_dict(
+                definition_kwargs["annotations"]
+            )
 
             # build definition schema
             definition_schema = ResourceDefinitionSchema(**definition_kwargs)
@@ -81,15 +67,13 @@ class ResourceSchemaAssembler(FeatureSchemaAssembler):
         self, page_size: int = 10, cursor: Optional[str] = None
     ):
         resource_schema_list = self._build_definition_schema(self.resource_list)
-        pagination = Pagination(page_size)
+        pagination = Pagination.for_size(page_size)
         paginated_resource_schema_list, next_cursor = pagination.paginate(
             resource_schema_list, cursor
         )
-        schema = ResourceListResultSchema(
-            resources=paginated_resource_schema_list, nextCursor=next_cursor
+        return self._build_list_result_dict(
+            "resources", paginated_resource_schema_list, next_cursor
         )
-        schema = self._build_non_none_dict(schema)
-        return schema
 
     def build_template_list_result_schema(
         self, page_size: int = 10, cursor: Optional[str] = None
@@ -97,38 +81,45 @@ class ResourceSchemaAssembler(FeatureSchemaAssembler):
         resource_template_schema_list = self._build_definition_schema(
             self.resource_template_list
         )
-        pagination = Pagination(page_size)
+        pagination = Pagination.for_size(page_size)
         paginated_template_schema_list, next_cursor = pagination.paginate(
             resource_template_schema_list, cursor
         )
-        schema = ResourceTemplateListResultSchema(
-            resourceTemplates=paginated_template_schema_list, nextCursor=next_cursor
+        return self._build_list_result_dict(
+            "resourceTemplates", paginated_template_schema_list, next_cursor
         )
-        schema = self._build_non_none_dict(schema)
-        return schema
 
     def process_content(self, resource_result, resource_registry):
         if not isinstance(resource_result, ResourceResult):
             raise self.UnsupportedResultTypeError(type(resource_result))
 
-        content_list = resource_result.content_list.copy()
-
-        for content in content_list:
-            # get info from content/registry/metadata
-            content.uri = content.uri or resource_registry.uri
-            content.name = content.name or resource_registry.extra.get("name")
-            content.title = content.title or resource_registry.extra.get("title")
-            content.annotations = content.annotations or resource_registry.extra.get(
-                "annotations"
-            )
-
-            if hasattr(resource_registry, "metadata"):
-                content.name = content.name or resource_registry.metadata.name
-                content.title = content.title or resource_registry.metadata.title
-
-            # only update the first content
-            break
-
-        result_schema = ResultSchema(contents=content_list)
-        result_schema = self._build_non_none_dict(result_schema)
-        return result_schema
+        contents = [
+            content.model_dump(exclude_none=True)
+            for content in resource_result.content_list
+        ]
+
+        if contents:
+            # only the first content is filled from the registry; the stored
+            # content models are left untouched
+            self._fill_content_defaults(contents[0], resource_registry)
+
+        return self._build_non_none_dict({"contents": contents})
+
+    def _fill_content_defaults(self, content: dict, resource_registry):
+        extra = resource_registry.extra
+        metadata = getattr(resource_registry, "metadata", None)
+        defaults = {
+            "uri": resource_registry.uri,
+            "name": extra.get("name") or (metadata and metadata.name),
+            "title": extra.get("title") or (metadata and metadata.title),
+        }
+        for key, value in defaults.items():
+            if not content.get(key) and value:
+                content[key] = value
+
+        if not content.get("annotations"):
+            annotations = extra.get("annotations")
+            if isinstance(annotations, dict):
+                annotations = AnnotationSchema(**annotations)
+            if annotations:
+                content["annotations"] = annotations.model_dump(exclude_none=True)
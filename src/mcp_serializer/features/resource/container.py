@@ -1,39 +1,30 @@
 from .assembler import ResourceSchemaAssembler
+from .registries import FunctionRegistry, ResultRegistry, _UriTrie
 from .result import ResourceResult
 from ..base.container import FeatureContainer
-from ..base.parsers import FunctionParser
-from ..base.definitions import FunctionMetadata
-from ..base.contents import MimeTypes
+from ..base.contents import HTTP_URI_PREFIXES, MimeTypes
 from urllib.parse import urlparse
 
 
-class ResultRegistry:
-    def __init__(self, result: ResourceResult, uri: str, extra: dict = None):
-        self.result = result
-        self.uri = uri
-        self.extra = extra or {}
-
-
-class FunctionRegistry:
-    def __init__(self, metadata: FunctionMetadata, uri: str, extra: dict = None):
-        self.metadata = metadata
-        self.uri = uri
-        self.extra = extra or {}
-
-
 class ResourceContainer(FeatureContainer):
     def __init__(self):
         self.schema_assembler = ResourceSchemaAssembler()
         self.registrations = {}
+        # uri without trailing slash -> first registered uri with that form
+        self._normalized_uris = {}
+        # prefix matching picks the longest, most specific registered uri
+        self._uri_trie = _UriTrie()
+
+    def _add_registration(self, uri: str, registry):
+        self._uri_trie.add(uri)
+        self.registrations[uri] = registry
+        self._normalized_uris.setdefault(uri.rstrip("/"), uri)
 
     def _add_http_resource(self, uri: str, extra: dict):
         """Determine mime type from URL file extension and add to extra."""
         if not extra.get("mime_type"):
-            try:
-                url_path = urlparse(uri).path
-                extra["mime_type"] = MimeTypes.get_mime_type(url_path)
-            except Exception:
-                pass
+            url_path = urlparse(uri).path
+            extra["mime_type"] = MimeTypes.get_mime_type(url_path)
 
         registry = ResultRegistry(None, uri, extra)
         self.schema_assembler.add_resource_registry(registry)
@@ -46,7 +37,7 @@ class ResourceContainer(FeatureContainer):
         **extra,
     ):
         # For HTTP URIs, content is optional - they appear in list but not callable
-        if uri.startswith(("http://", "https://")) and result is None:
+        if uri.startswith(HTTP_URI_PREFIXES) and result is None:
             return self._add_http_resource(uri, extra)
 
         # For non-HTTP URIs or when result is provided, result is required
@@ -55,11 +46,11 @@ class ResourceContainer(FeatureContainer):
 
         registry = ResultRegistry(result, uri, extra)
         self.schema_assembler.add_resource_registry(registry)
-        self.registrations[uri] = registry
+        self._add_registration(uri, registry)
         return registry
 
     def register(self, func, uri: str, **extra):
-        function_metadata = FunctionParser(func).function_metadata
+        function_metadata = self._get_function_metadata(func)
 
         # strip trailing slash for resource templates
         if function_metadata.has_arguments:
@@ -73,34 +64,30 @@ class ResourceContainer(FeatureContainer):
 
         registry = FunctionRegistry(function_metadata, uri, extra)
         self.schema_assembler.add_resource_registry(registry)
-        self.registrations[uri] = registry
+        self._add_registration(uri, registry)
 
         return function_metadata
 
     def _find_exact_match(self, uri: str):
-        normalized_uri = uri.rstrip("/")
-        for saved_uri in self.registrations.keys():
-            if normalized_uri == saved_uri.rstrip("/"):
-                return self.registrations[saved_uri]
-        return None
+        saved_uri = self._normalized_uris.get(uri.rstrip("/"))
+        if saved_uri is None:
+            return None
+        return self.registrations[saved_uri]
 
     def _find_prefix_match(self, uri: str):
-        for saved_uri in sorted(self.registrations.keys()):
-            if uri.startswith(saved_uri):
-                return self.registrations[saved_uri]
-        return None
+        saved_uri = self._uri_trie.longest_prefix(uri)
+        if saved_uri is None:
+            return None
+        return self.registrations[saved_uri]
 
     def _extract_path_params(self, uri: str, registry):
         remaining_path = uri[len(registry.uri) :].strip("/")
         param_list = remaining_path.split("/") if remaining_path else []
 
-        params = {}
         if isinstance(registry, FunctionRegistry) and param_list:
-            for i, param_value in enumerate(param_list):
-                if i < len(registry.metadata.arguments):
-                    arg_name = registry.metadata.arguments[i].name
-                    params[arg_name] = param_value
-        return params
+            # zip drops path segments beyond the function's arguments
+            return dict(zip(registry.arg_names, param_list))
+        return {}
 
     def _get_registry(self, uri: str):
         # Try exact match first
@@ -117,14 +104,20 @@ class ResourceContainer(FeatureContainer):
 
         return registry, params
 
+    def has_uri(self, uri: str) -> bool:
+        """Return whether uri resolves to a registered resource."""
+        return (
+            self._find_exact_match(uri) is not None
+            or self._find_prefix_match(uri) is not None
+        )
+
     def call(self, uri):
         registry, parsed_params = self._get_registry(uri)
 
         if isinstance(registry, FunctionRegistry):
-            validated_params = self._validate_parameters(
-                registry.metadata, parsed_params
-            )
-            result = self._call_function(registry.metadata.function, validated_params)
+            metadata = registry.metadata
+            validated_params = self._validate_parameters(metadata, parsed_params)
+            result = self._call_function(metadata.function, validated_params)
         else:
             result = registry.result
 
@@ -0,0 +1,117 @@
+from .result import ResourceResult
+from ..base.definitions import FunctionMetadata
+
+
+class ResultRegistry:
+    __slots__ = ("result", "uri", "extra", "_definition_kwargs")
+
+    def __init__(self, result: ResourceResult, uri: str, extra: dict = None):
+        self.result = result
+        self.uri = uri
+        self.extra = extra or {}
+        self._definition_kwargs = None
+
+    @property
+    def definition_kwargs(self) -> dict:
+        """Keyword arguments for ResourceDefinitionSchema, resolved once."""
+        if self._definition_kwargs is None:
+            self._definition_kwargs = _build_definition_kwargs(self.uri, self.extra)
+        return self._definition_kwargs
+
+
+class FunctionRegistry:
+    __slots__ = (
+        "metadata",
+        "uri",
+        "extra",
+        "_template_uri",
+        "_arg_names",
+        "_definition_kwargs",
+    )
+
+    def __init__(self, metadata: FunctionMetadata, uri: str, extra: dict = None):
+        self.metadata = metadata
+        self.uri = uri
+        self.extra = extra or {}
+        self._template_uri = None
+        self._arg_names = None
+        self._definition_kwargs = None
+
+    @property
+    def template_uri(self) -> str:
+        """The uri followed by a /{name} segment per required argument."""
+        if self._template_uri is None:
+            self._template_uri = self.uri + "".join(
+                "/{" + argument.name + "}"
+                for argument in self.metadata.arguments
+                if argument.required
+            )
+        return self._template_uri
+
+    @property
+    def arg_names(self) -> tuple:
+        """Argument names in order, matched against uri path segments."""
+        if self._arg_names is None:
+            self._arg_names = tuple(
+                argument.name for argument in self.metadata.arguments
+            )
+        return self._arg_names
+
+    @property
+    def definition_kwargs(self) -> dict:
+        """Keyword arguments for ResourceDefinitionSchema, resolved once.
+
+        Extra values take precedence over the function's parsed metadata.
+        """
+        if self._definition_kwargs is None:
+            self._definition_kwargs = _build_definition_kwargs(
+                self.template_uri, self.extra, self.metadata
+            )
+        return self._definition_kwargs
+
+
+def _build_definition_kwargs(uri: str, extra: dict, metadata=None) -> dict:
+    kwargs = {
+        "uri": uri,
+        "name": extra.get("name"),
+        "title": extra.get("title"),
+        "description": extra.get("description"),
+        "mimeType": extra.get("mime_type"),
+        "size": extra.get("size"),
+        "annotations": extra.get("annotations"),
+    }
+    if metadata is not None:
+        kwargs["name"] = kwargs["name"] or metadata.name
+        kwargs["title"] = kwargs["title"] or metadata.title
+        kwargs["description"] = kwargs["description"] or metadata.description
+    return kwargs
+
+
+class _UriTrie:
+    """Character trie of registered URIs for longest prefix lookups.
+
+    Nodes are dicts keyed by character; the None key holds the URI that ends
+    at that node.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self):
+        self._root = {}
+
+    def add(self, uri: str):
+        node = self._root
+        for char in uri:
+            node = node.setdefault(char, {})
+        node[None] = uri
+
+    def longest_prefix(self, uri: str):
+        """Return the longest added URI that uri starts with, or None."""
+        node = self._root
+        match = node.get(None)
+        for char in uri:
+            node = node.get(char)
+            if node is None:
+                break
+            match = node.get(None, match)
+        return match
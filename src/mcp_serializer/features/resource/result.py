@@ -1,5 +1,5 @@
-import base64
 from ..base.parsers import FileParser
+from ..base.contents import is_base64
 from ..base.definitions import ContentTypes, FileMetadata
 from .schema import TextContentSchema, BinaryContentSchema
 
@@ -47,9 +47,7 @@ class ResourceResult:
         # Validate base64 format
         if not blob or not isinstance(blob, str):
             raise ValueError("Blob must be a non-empty string")
-        try:
-            base64.b64decode(blob, validate=True)
-        except Exception:
+        if not is_base64(blob):
             raise ValueError("Blob must be valid base64 encoded data")
 
         binary_content = BinaryContentSchema(
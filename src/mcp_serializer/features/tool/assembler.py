@@ -1,9 +1,14 @@
 from typing import Optional
 from pydantic import BaseModel
 from pydantic_core import PydanticUndefined
-import inspect
+import functools
 from ..base.pagination import Pagination
-from .schema import ToolsDefinitionSchema, ToolsListSchema, ResultSchema, TextContent
+from .schema import (
+    ToolsDefinitionSchema,
+    ToolsListDict,
+    ToolResultDict,
+    TextContent,
+)
 from ..base.assembler import FeatureSchemaAssembler
 from ..base.schema import JsonSchema
 from .result import ToolsResult
@@ -71,23 +76,13 @@ class ToolsSchemaAssembler(FeatureSchemaAssembler):
             return None
 
         # Check if return type is a Pydantic BaseModel
-        if inspect.isclass(metadata.return_type) and issubclass(
+        if isinstance(metadata.return_type, type) and issubclass(
             metadata.return_type, BaseModel
         ):
             output_schema = JsonSchema()
 
-            # Get fields from Pydantic model
-            if hasattr(metadata.return_type, "model_fields"):
-                for field_name, field_info in metadata.return_type.model_fields.items():
-                    has_default = field_info.default is not PydanticUndefined
-                    output_schema.add_property(
-                        name=field_name,
-                        type_hint=field_info.annotation,
-                        description=field_info.description,
-                        required=field_info.is_required(),
-                        default=field_info.default if has_default else None,
-                        has_default=has_default,
-                    )
+            for field_spec in _model_field_specs(metadata.return_type):
+                output_schema.add_property(**field_spec)
 
             return output_schema
 
@@ -95,32 +90,54 @@ class ToolsSchemaAssembler(FeatureSchemaAssembler):
 
     def build_list_result_schema(
         self, page_size: int = 10, cursor: Optional[str] = None
-    ):
-        pagination = Pagination(page_size)
+    ) -> ToolsListDict:
+        pagination = Pagination.for_size(page_size)
         paginated_tools, next_cursor = pagination.paginate(self.tools_list, cursor)
-        return ToolsListSchema(
-            tools=paginated_tools, nextCursor=next_cursor
-        ).model_dump()
+        return self._build_list_result_dict("tools", paginated_tools, next_cursor)
 
-    def process_result(self, result):
-        result_schema = ResultSchema()
+    def process_result(self, result) -> ToolResultDict:
+        # content is always present, so pruning never empties the dict
+        result_dict = {"content": []}
         if isinstance(result, ToolsResult):
             if result.content_list:
-                result_schema.content = [
+                result_dict["content"] = [
                     item.model_dump() if hasattr(item, "model_dump") else item
                     for item in result.content_list
                 ]
             if result.structured_content:
-                result_schema.structuredContent = result.structured_content
+                result_dict["structuredContent"] = result.structured_content
             if result.is_error:
-                result_schema.isError = result.is_error
+                result_dict["isError"] = result.is_error
         elif isinstance(result, BaseModel):
-            result_schema.structuredContent = result.model_dump()
+            result_dict["structuredContent"] = result.model_dump()
         elif isinstance(result, dict):
-            result_schema.structuredContent = result
+            result_dict["structuredContent"] = result
         elif isinstance(result, str):
-            result_schema.content = [TextContent(text=result).model_dump()]
+            result_dict["content"] = [TextContent(text=result).model_dump()]
         else:
             raise self.UnsupportedResultTypeError(type(result))
 
-        return self._build_non_none_dict(result_schema)
+        return self._remove_none_from_dict(result_dict)
+
+
+@functools.lru_cache(maxsize=256)
+def _model_field_specs(model) -> tuple:
+    """Return add_property keyword arguments for a model's fields.
+
+    Reading model_fields happens once per model; callers must not mutate the
+    returned dicts.
+    """
+    specs = []
+    for field_name, field_info in getattr(model, "model_fields", {}).items():
+        has_default = field_info.default is not PydanticUndefined
+        specs.append(
+            {
+                "name": field_name,
+                "type_hint": field_info.annotation,
+                "description": field_info.description,
+                "required": field_info.is_required(),
+                "default": field_info.default if has_default else None,
+                "has_default": has_default,
+            }
+        )
+    return tuple(specs)
@@ -4,6 +4,8 @@ from .assembler import ToolsSchemaAssembler
 
 
 class ToolRegistry:
+    __slots__ = ("metadata", "extra")
+
     def __init__(self, metadata: FunctionMetadata, extra: dict = None):
         self.metadata = metadata
         self.extra = extra or {}
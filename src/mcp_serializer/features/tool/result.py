@@ -1,7 +1,7 @@
 from typing import Optional, Dict, Any, Union
 from pydantic import BaseModel
 from urllib.parse import urlparse
-from ..base.contents import MimeTypes
+from ..base.contents import HTTP_URI_PREFIXES, MimeTypes
 from ..base.parsers import FileParser
 from ..base.definitions import ContentTypes
 from .schema import (
@@ -15,6 +15,8 @@ from ..resource.schema import TextContentSchema, BinaryContentSchema
 
 
 class ToolsResult:
+    __slots__ = ("content_list", "structured_content", "is_error")
+
     def __init__(self, is_error: bool = False):
         self.content_list = []
         self.structured_content = None
@@ -102,21 +104,7 @@ class ToolsResult:
         if not resource_container:
             raise ValueError("No resource has been defined for this registry")
 
-        # get from resource list
-        for resource_registry in resource_container.schema_assembler.resource_list:
-            if resource_registry.uri.rstrip("/") == uri.rstrip("/"):
-                return resource_registry
-
-        # get from resource template list
-        for (
-            resource_template_registry
-        ) in resource_container.schema_assembler.resource_template_list:
-            if uri.startswith(resource_template_registry.uri):
-                return resource_template_registry
-
-        # to do get http resource info from resource container's assembler
-
-        return None
+        return resource_container.schema_assembler.get_resource_registry(uri)
 
     def _get_mime_type_from_http_uri(self, uri: str) -> str:
         try:
@@ -135,7 +123,7 @@ class ToolsResult:
         mime_type: Optional[str] = None,
         annotations: Optional[Dict[str, Any]] = None,
     ) -> ResourceLinkContent:
-        is_http = uri.startswith(("http://", "https://"))
+        is_http = uri.startswith(HTTP_URI_PREFIXES)
         if is_http:
             mime_type = mime_type or self._get_mime_type_from_http_uri(uri)
         elif not registry:
@@ -212,7 +200,8 @@ class ToolsResult:
                 "Either 'text' or 'blob' must be provided for embedded resource"
             )
 
-        embedded_resource = EmbeddedResource(resource=resource_schema)
+        # resource_schema was validated when it was built just above
+        embedded_resource = EmbeddedResource.model_construct(resource=resource_schema)
         self.content_list.append(embedded_resource)
         return embedded_resource
 
@@ -1,7 +1,6 @@
-import base64
-from pydantic import BaseModel, field_validator
-from typing import Optional, Dict, Any, List, Union
-from ..base.schema import JsonSchema
+from pydantic import BaseModel
+from typing import Optional, Dict, Any, List, Union, TypedDict
+from ..base.schema import Base64DataModel, JsonSchema
 from ..resource.schema import TextContentSchema, BinaryContentSchema
 from ..resource.schema import AnnotationSchema
 
@@ -20,6 +19,13 @@ class ToolsListSchema(BaseModel):
     nextCursor: Optional[str] = None
 
 
+class ToolsListDict(TypedDict, total=False):
+    """Tools list page built by the assembler; nextCursor is omitted at the end."""
+
+    tools: List[dict]
+    nextCursor: str
+
+
 # Content schema classes for tools
 class TextContent(BaseModel):
     type: str = "text"
@@ -27,37 +33,19 @@ class TextContent(BaseModel):
     annotations: Optional[Dict[str, Any]] = None
 
 
-class ImageContent(BaseModel):
+class ImageContent(Base64DataModel):
     type: str = "image"
     data: str  # Base64-encoded image data
     mimeType: Optional[str] = None
     annotations: Optional[Dict[str, Any]] = None
 
-    @field_validator("data")
-    @classmethod
-    def validate_base64_data(cls, v):
-        try:
-            base64.b64decode(v, validate=True)
-        except Exception:
-            raise ValueError("Data must be valid base64 encoded string")
-        return v
-
 
-class AudioContent(BaseModel):
+class AudioContent(Base64DataModel):
     type: str = "audio"
     data: str  # Base64-encoded audio data
     mimeType: Optional[str] = None
     annotations: Optional[Dict[str, Any]] = None
 
-    @field_validator("data")
-    @classmethod
-    def validate_base64_data(cls, v):
-        try:
-            base64.b64decode(v, validate=True)
-        except Exception:
-            raise ValueError("Data must be valid base64 encoded string")
-        return v
-
 
 class ResourceLinkContent(BaseModel):
     type: str = "resource_link"
@@ -78,3 +66,11 @@ class ResultSchema(BaseModel):
     content: Optional[List[dict]] = []
     structuredContent: Optional[dict] = None
     isError: Optional[bool] = None
+
+
+class ToolResultDict(TypedDict, total=False):
+    """Tool call result built by the assembler; keys without a value are omitted."""
+
+    content: List[dict]
+    structuredContent: dict
+    isError: bool
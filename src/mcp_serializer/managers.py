@@ -1,5 +1,4 @@
 from typing import Union, List
-from copy import deepcopy
 
 from pydantic import BaseModel
 
@@ -17,6 +16,80 @@ from .features.base.assembler import FeatureSchemaAssembler
 from .contexts import ResponseContext
 
 
+def _server_error(code: int, message: str):
+    def build(e, data):
+        return errors.RPCServerError(code, message, data)
+
+    return build
+
+
+def _invalid_parameter_error(feature_name: str):
+    def build(e, data):
+        data["invalid_parameter_name"] = e.param_name
+        data["invalid_parameter_value"] = e.value
+        data["expected_parameter_type"] = e.param_type
+        return errors.InvalidParams(
+            message=f"Invalid parameters for {feature_name}", data=data
+        )
+
+    return build
+
+
+def _missing_parameter_error(feature_name: str):
+    def build(e, data):
+        data["missing_parameter"] = e.param_name
+        return errors.InvalidParams(
+            message=f"Required parameter not found for {feature_name}", data=data
+        )
+
+    return build
+
+
+def _missing_template_parameter_error(e, data):
+    data["missing_parameter"] = e.param_name
+    return errors.RPCServerError(
+        -32005, "Parameter is required in resource template", data
+    )
+
+
+def _unsupported_result_error(e, data):
+    return errors.InternalError(
+        e, "Feature returned unsupported type. Check return values."
+    )
+
+
+# exception type -> builder of the rpc error reported for it, per feature
+_TOOLS_ERROR_BUILDERS = {
+    FeatureContainer.FunctionCallError: _server_error(-32001, "Tools call error"),
+    FeatureContainer.RegistryNotFound: _server_error(-32002, "Could not find tool"),
+    FeatureContainer.ParameterTypeCastingError: _invalid_parameter_error("tools"),
+    FeatureContainer.RequiredParameterNotFound: _missing_parameter_error("tools"),
+}
+
+_RESOURCES_ERROR_BUILDERS = {
+    FeatureContainer.FunctionCallError: _server_error(-32003, "Resources fetch error"),
+    FeatureContainer.RegistryNotFound: _server_error(-32004, "Could not find resource"),
+    FeatureContainer.RequiredParameterNotFound: _missing_template_parameter_error,
+    FeatureSchemaAssembler.UnsupportedResultTypeError: _unsupported_result_error,
+}
+
+_PROMPTS_ERROR_BUILDERS = {
+    FeatureContainer.FunctionCallError: _server_error(-32006, "Prompts call error"),
+    FeatureContainer.RegistryNotFound: _server_error(-32007, "Could not find prompt"),
+    FeatureContainer.ParameterTypeCastingError: _invalid_parameter_error("prompts"),
+    FeatureContainer.RequiredParameterNotFound: _missing_parameter_error("prompts"),
+}
+
+
+def _find_error_builder(error_builders: dict, e: Exception):
+    # The exception's own type is checked first, then its base classes
+    for error_type in type(e).__mro__:
+        build_error = error_builders.get(error_type)
+        if build_error is not None:
+            return build_error
+    return None
+
+
 class RPCRequestManager:
     class InvalidMethod(Exception):
         def __init__(self, method_type: str):
@@ -44,6 +117,12 @@ class RPCRequestManager:
         self.registry = registry
         self.initializer = initializer
         self.page_size = page_size
+        self._processor_mapping = {
+            self.MethodPrefix.initialize: self._process_initialize_request,
+            self.MethodPrefix.tools: self._process_tools_request,
+            self.MethodPrefix.resources: self._process_resources_request,
+            self.MethodPrefix.prompts: self._process_prompts_request,
+        }
 
     def _process_initialize_request(self, rpc_params, **kwargs):
         result = self.initializer.build_result(rpc_params)
@@ -80,26 +159,10 @@ class RPCRequestManager:
                 return self.registry.tools_container.call(name, **kwargs)
             except Exception as e:
                 data = {"tool_name": name, "arguments": kwargs, "error": str(e)}
-
-                if isinstance(e, FeatureContainer.FunctionCallError):
-                    error = errors.RPCServerError(-32001, "Tools call error", data)
-                elif isinstance(e, FeatureContainer.RegistryNotFound):
-                    error = errors.RPCServerError(-32002, "Could not find tool", data)
-                elif isinstance(e, FeatureContainer.ParameterTypeCastingError):
-                    data["invalid_parameter_name"] = e.param_name
-                    data["invalid_parameter_value"] = e.value
-                    data["expected_parameter_type"] = e.param_type
-                    error = errors.InvalidParams(
-                        message="Invalid parameters for tools", data=data
-                    )
-                elif isinstance(e, FeatureContainer.RequiredParameterNotFound):
-                    data["missing_parameter"] = e.param_name
-                    error = errors.InvalidParams(
-                        message="Required parameter not found for tools", data=data
-                    )
-                else:
-                    raise e
-                raise self.ProcessingError("tools", error) from e
+                build_error = _find_error_builder(_TOOLS_ERROR_BUILDERS, e)
+                if build_error is None:
+                    raise
+                raise self.ProcessingError("tools", build_error(e, data)) from e
         else:
             raise self.InvalidMethod(method_type)
 
@@ -120,24 +183,10 @@ class RPCRequestManager:
                 return self.registry.resource_container.call(uri)
             except Exception as e:
                 data = {"uri": uri, "error": str(e)}
-                if isinstance(e, FeatureContainer.FunctionCallError):
-                    error = errors.RPCServerError(-32003, "Resources fetch error", data)
-                elif isinstance(e, FeatureContainer.RegistryNotFound):
-                    error = errors.RPCServerError(
-                        -32004, "Could not find resource", data
-                    )
-                elif isinstance(e, FeatureContainer.RequiredParameterNotFound):
-                    data["missing_parameter"] = e.param_name
-                    error = errors.RPCServerError(
-                        -32005, "Parameter is required in resource template", data
-                    )
-                elif isinstance(e, FeatureSchemaAssembler.UnsupportedResultTypeError):
-                    error = errors.InternalError(
-                        e, "Feature returned unsupported type. Check return values."
-                    )
-                else:
-                    raise e
-                raise self.ProcessingError("resources", error) from e
+                build_error = _find_error_builder(_RESOURCES_ERROR_BUILDERS, e)
+                if build_error is None:
+                    raise
+                raise self.ProcessingError("resources", build_error(e, data)) from e
         else:
             raise self.InvalidMethod(method_type)
 
@@ -155,36 +204,13 @@ class RPCRequestManager:
                 return self.registry.prompt_container.call(name, **kwargs)
             except Exception as e:
                 data = {"prompt_name": name, "arguments": kwargs, "error": str(e)}
-                if isinstance(e, FeatureContainer.FunctionCallError):
-                    error = errors.RPCServerError(-32006, "Prompts call error", data)
-                elif isinstance(e, FeatureContainer.RegistryNotFound):
-                    error = errors.RPCServerError(-32007, "Could not find prompt", data)
-                elif isinstance(e, FeatureContainer.ParameterTypeCastingError):
-                    data["invalid_parameter_name"] = e.param_name
-                    data["invalid_parameter_value"] = e.value
-                    data["expected_parameter_type"] = e.param_type
-                    error = errors.InvalidParams(
-                        message="Invalid parameters for prompts", data=data
-                    )
-                elif isinstance(e, FeatureContainer.RequiredParameterNotFound):
-                    data["missing_parameter"] = e.param_name
-                    error = errors.InvalidParams(
-                        message="Required parameter not found for prompts", data=data
-                    )
-                else:
-                    raise e
-                raise self.ProcessingError("prompts", error) from e
+                build_error = _find_error_builder(_PROMPTS_ERROR_BUILDERS, e)
+                if build_error is None:
+                    raise
+                raise self.ProcessingError("prompts", build_error(e, data)) from e
         else:
             raise self.InvalidMethod(method_type)
 
-    def _get_processor_mapping(self):
-        return {
-            self.MethodPrefix.initialize: self._process_initialize_request,
-            self.MethodPrefix.tools: self._process_tools_request,
-            self.MethodPrefix.resources: self._process_resources_request,
-            self.MethodPrefix.prompts: self._process_prompts_request,
-        }
-
     def _pop_cursor_param(self, rpc_params):
         if "cursor" in rpc_params:
             cursor = rpc_params.pop("cursor")
@@ -198,26 +224,23 @@ class RPCRequestManager:
             raise ValueError(f"Invalid result type: {type(result)}")
         return result
 
+    def _handle_notification(self, rpc_request: JsonRpcRequest):
+        get_logger().info(f"Notification: {rpc_request.method}")
+
     def _get_request_result(self, rpc_request: JsonRpcRequest) -> Union[dict, None]:
         """It creates result from a rpc request."""
-        # log if notification
-        if rpc_request.id is None:
-            get_logger().info(f"Notification: {rpc_request.method}")
-            return None
-
-        processor_mapping = self._get_processor_mapping()
-
         # prepare processor
-        try:
-            method_name, method_type = rpc_request.method.split("/", 1)
-        except Exception:
-            method_name, method_type = rpc_request.method, None
+        method_name, separator, method_type = rpc_request.method.partition("/")
+        if not separator:
+            method_type = None
 
-        if method_name not in processor_mapping:
+        processor = self._processor_mapping.get(method_name)
+        if processor is None:
             raise self.InvalidMethod(method_name)
 
-        processor = processor_mapping[method_name]
-        params = deepcopy(rpc_request.params)
+        # only the top level cursor key is popped, so a shallow copy keeps the
+        # request's params intact
+        params = dict(rpc_request.params) if rpc_request.params else {}
         cursor = self._pop_cursor_param(params)
 
         # process request
@@ -231,10 +254,20 @@ class RPCRequestManager:
     def _process_single_request(
         self, rpc_request: JsonRpcRequest
     ) -> Union[JsonRpcErrorResponse, JsonRpcSuccessResponse, None]:
+        # notifications get no response, so they skip dispatch entirely
+        if rpc_request.id is None:
+            self._handle_notification(rpc_request)
+            return None
+
         try:
             result = self._get_request_result(rpc_request)
             response = (
-                JsonRpcSuccessResponse(id=rpc_request.id, result=result)
+                # result is already a plain dict, so only the id needs the
+                # conversion validation would have applied
+                JsonRpcSuccessResponse.model_construct(
+                    id=JsonRpcSuccessResponse.convert_id_to_int(rpc_request.id),
+                    result=result,
+                )
                 if result
                 else None
             )
@@ -1,5 +1,6 @@
 from typing import Union, BinaryIO
 
+from .features.base.contents import HTTP_URI_PREFIXES
 from .features.base.parsers import FileParser
 from .features.prompt.container import PromptsContainer
 from .features.resource.container import ResourceContainer
@@ -85,7 +86,7 @@ class MCPRegistry:
         size: int = None,
         annotations: dict = None,
     ):
-        if not uri.startswith(("http://", "https://")):
+        if not uri.startswith(HTTP_URI_PREFIXES):
             raise ValueError("URI must start with http:// or https://")
 
         return self._get_resource_container().add_resource(
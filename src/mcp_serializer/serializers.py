@@ -3,8 +3,9 @@ JSON-RPC 2.0 serializers for handling request and response data.
 """
 
 import json
+import re
 from typing import Union, List
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from .schema import JsonRpcRequest
 from .registry import MCPRegistry
@@ -13,6 +14,39 @@ from .initializer import MCPInitializer
 from . import errors
 from .contexts import ResponseContext
 
+try:
+    # Optional faster parser, used only where it gives the same result as json
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Digit runs this long may be integers beyond 64 bits, which orjson does not
+# parse to the exact int that json.loads returns
+_LONG_DIGITS_RE = re.compile(r"\d{20}")
+_LONG_DIGITS_BYTES_RE = re.compile(rb"\d{20}")
+
+
+def _loads(data: Union[str, bytes, bytearray]):
+    """Parse JSON with the same result and errors as json.loads."""
+    if orjson is not None:
+        pattern = _LONG_DIGITS_RE if isinstance(data, str) else _LONG_DIGITS_BYTES_RE
+        if pattern.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # json.loads also accepts NaN, Infinity and lone surrogates,
+                # and reports invalid JSON with its own message
+                pass
+    return json.loads(data)
+
+
+# Marks that no invalid batch item was found; None itself can be an item
+_MISSING = object()
+
+# Validates a whole batch in one call rather than one model at a time
+_BATCH_REQUEST_ADAPTER = TypeAdapter(List[JsonRpcRequest])
+
 
 class MCPSerializer:
     """Serializer for MCP requests with JSON-RPC 2.0 protocol."""
@@ -24,19 +58,24 @@ class MCPSerializer:
         self.registry = registry
         self.request_manager = RPCRequestManager(initializer, registry, page_size)
 
-    def validate(self, request_data: Union[str, dict, list]) -> Union[dict, list]:
-        if isinstance(request_data, str):
+    def validate(
+        self, request_data: Union[str, bytes, bytearray, dict, list]
+    ) -> Union[dict, list]:
+        if isinstance(request_data, (str, bytes, bytearray)):
             try:
-                request_data = json.loads(request_data)
+                request_data = _loads(request_data)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON: {e}")
 
         if isinstance(request_data, list):
-            for item in request_data:
-                if not isinstance(item, dict):
-                    raise ValueError(
-                        f"Invalid request data. All items in the list must be dicts. Found {type(item)}"
-                    )
+            invalid_item = next(
+                (item for item in request_data if not isinstance(item, dict)),
+                _MISSING,
+            )
+            if invalid_item is not _MISSING:
+                raise ValueError(
+                    f"Invalid request data. All items in the list must be dicts. Found {type(invalid_item)}"
+                )
         elif not isinstance(request_data, dict):
             raise ValueError(
                 f"Invalid request data. Needs to be a dict or list of dicts. Found {type(request_data)}"
@@ -49,16 +88,15 @@ class MCPSerializer:
     ) -> Union[JsonRpcRequest, List[JsonRpcRequest]]:
         try:
             if isinstance(request_data, list):
-                deserialized_data = []
-                for item in request_data:
-                    deserialized_data.append(JsonRpcRequest(**item))
-                return deserialized_data
+                return _BATCH_REQUEST_ADAPTER.validate_python(request_data)
             else:
-                return JsonRpcRequest(**request_data)
+                return JsonRpcRequest.model_validate(request_data)
         except ValidationError as e:
             raise ValueError(f"Invalid JSON-RPC 2.0 request: {e}")
 
-    def process_request(self, request_data: Union[str, dict, list]) -> ResponseContext:
+    def process_request(
+        self, request_data: Union[str, bytes, bytearray, dict, list]
+    ) -> ResponseContext:
         """Process a JSON-RPC 2.0 request and return a ResponseContext.
 
         This method handles the complete request-response cycle for MCP servers:
@@ -69,7 +107,7 @@ class MCPSerializer:
 
         Args:
             request_data: The JSON-RPC request data. Can be:
-                - A JSON string (will be parsed)
+                - A JSON string, bytes or bytearray (will be parsed)
                 - A dict representing a single request
                 - A list of dicts representing a batch request
 
@@ -107,7 +145,11 @@ class MCPSerializer:
             response_context = ResponseContext()
             response_context.add_context(
                 error.get_response(None),
-                JsonRpcRequest(jsonrpc="2.0", method="unknown", params=request_data),
+                JsonRpcRequest(
+                    jsonrpc="2.0",
+                    method="unknown",
+                    params=request_data if isinstance(request_data, dict) else {},
+                ),
             )
             return response_context
 
@@ -118,7 +160,11 @@ class MCPSerializer:
             response_context = ResponseContext()
             response_context.add_context(
                 error.get_response(None),
-                JsonRpcRequest(jsonrpc="2.0", method="unknown", params=request_data),
+                JsonRpcRequest(
+                    jsonrpc="2.0",
+                    method="unknown",
+                    params=request_data if isinstance(request_data, dict) else {},
+                ),
             )
             return response_context
 
@@ -1,4 +1,8 @@
-from mcp_serializer.features.base.contents import MimeTypes
+import os
+import base64
+
+from mcp_serializer.features.base.contents import MimeTypes, is_base64
+from mcp_serializer.features.base.definitions import ContentTypes
 
 
 class TestMimeTypes:
@@ -71,3 +75,63 @@ class TestMimeTypes:
         assert MimeTypes.Image.from_file_name("photo.PNG") == MimeTypes.Image.PNG
         assert MimeTypes.Audio.from_file_name("song.MP3") == MimeTypes.Audio.MP3
         assert MimeTypes.Text.from_file_name("script.PY") == MimeTypes.Text.PYTHON
+
+    def test_content_candidates(self):
+        assert MimeTypes.get_content_candidates("a.svg") == (
+            (ContentTypes.TEXT, MimeTypes.Text.SVG),
+            (ContentTypes.IMAGE, MimeTypes.Image.SVG),
+        )
+        assert MimeTypes.get_content_candidates("a.MP3") == (
+            (ContentTypes.AUDIO, MimeTypes.Audio.MP3),
+        )
+        assert MimeTypes.get_content_candidates("a.unknown") == ()
+
+    def test_get_mime_type_prefers_text_then_image_then_audio(self):
+        assert MimeTypes.get_mime_type("/static/logo.svg") == MimeTypes.Text.SVG
+        assert MimeTypes.get_mime_type("/static/photo.JPG") == MimeTypes.Image.JPEG
+        assert MimeTypes.get_mime_type("/media/song.mp3") == MimeTypes.Audio.MP3
+        assert MimeTypes.get_mime_type("/files/archive") is None
+
+    def test_file_name_extension_matches_splitext(self):
+        names = ["a.png", ".png", "dir.d/file", "dir/.hidden", "x..png", "", "a."]
+        for name in names:
+            expected = os.path.splitext(name)[1].lower()
+            assert MimeTypes.Image._get_file_name_extension(name) == expected, name
+
+
+class TestIsBase64:
+    def test_valid_base64(self):
+        for raw in [b"", b"a", b"ab", b"abc", b"hello world", bytes(range(256))]:
+            encoded = base64.b64encode(raw)
+            assert is_base64(encoded)
+            assert is_base64(encoded.decode("ascii"))
+
+    def test_invalid_base64(self):
+        invalid_values = ["a", "abc", "ab=", "=", "a===", "ab=c", "ab\ncd", "abç="]
+
+        for value in invalid_values:
+            assert not is_base64(value), f"Failed for {value!r}"
+
+    def test_padding_rules(self):
+        cases = {
+            "": True,
+            "QQ==": True,
+            "QUI=": True,
+            "QUJD": True,
+            "QUJDQQ==": True,
+            "QQ": False,
+            "QUI": False,
+            "QQ=": False,
+            "QUJD=": False,
+            "QQQQ=": False,
+            "QUI==": False,
+            "Q===": False,
+            "=": False,
+            "==": False,
+            "====": False,
+            "Q!==": False,
+        }
+
+        for value, expected in cases.items():
+            for data in (value, value.encode("ascii")):
+                assert is_base64(data) is expected, f"Failed for {data!r}"
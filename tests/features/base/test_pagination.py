@@ -16,6 +16,14 @@ class TestPagination:
         with pytest.raises(ValueError, match="Page size must be greater than 0"):
             Pagination(-1)
 
+    def test_for_size_reuses_instances(self):
+        """Test shared pagination instances per page size."""
+        assert Pagination.for_size(10) is Pagination.for_size(10)
+        assert Pagination.for_size(5).size == 5
+
+        with pytest.raises(ValueError, match="Page size must be greater than 0"):
+            Pagination.for_size(0)
+
     def test_paginate_empty_list(self):
         """Test pagination with empty list."""
         pagination = Pagination(5)
@@ -44,6 +52,15 @@ class TestPagination:
         with pytest.raises(Pagination.InvalidCursorError, match="Invalid cursor"):
             pagination.paginate(test_items, "not_base64!")
 
+        with pytest.raises(Pagination.InvalidCursorError, match="Invalid cursor"):
+            pagination.paginate(test_items, "Mw==é")
+
+    def test_cursor_round_trip(self):
+        pagination = Pagination(3)
+
+        assert pagination._encode_cursor(12) == "MTI="
+        assert pagination._decode_cursor("MTI=") == 12
+
     def test_pagination_with_cursor(self):
         """Test pagination with cursor using invalid cursor to test decode functionality."""
         pagination = Pagination(3)
@@ -1,6 +1,14 @@
+import pytest
+import dataclasses
+import gc
+import os
+import threading
+import weakref
+import base64
 from typing import List, Optional
-from mcp_serializer.features.base.definitions import FunctionMetadata
-from mcp_serializer.features.base.parsers import FunctionParser
+from mcp_serializer.features.base.contents import MimeTypes
+from mcp_serializer.features.base.definitions import FunctionMetadata, ContentTypes
+from mcp_serializer.features.base.parsers import FunctionParser, FileParser
 
 
 class TestFunctionParser:
@@ -209,3 +217,257 @@ class TestFunctionParser:
         assert len(metadata_dict["arguments"]) == 2
         assert metadata_dict["arguments"][0]["required"] == True
         assert metadata_dict["arguments"][1]["required"] == False
+
+    def test_argument_metadata_fields(self):
+        def func(value: int):
+            pass
+
+        argument = FunctionParser(func).function_metadata.arguments[0]
+
+        assert [f.name for f in dataclasses.fields(argument)] == [
+            "name",
+            "type_hint",
+            "description",
+            "required",
+            "default",
+        ]
+        assert dataclasses.asdict(argument)["name"] == "value"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            argument.name = "changed"
+
+    def test_cached_metadata_shares_frozen_arguments(self):
+        def func(value: int):
+            pass
+
+        first = FunctionParser(func).function_metadata
+        second = FunctionParser(func).function_metadata
+
+        assert first is not second
+        assert first.arguments[0] is second.arguments[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.arguments[0].required = False
+
+    def test_function_metadata_to_dict_returns_fresh_argument_dicts(self):
+        def func(value: int):
+            pass
+
+        metadata = FunctionParser(func).function_metadata
+        first = metadata.to_dict()
+        first["arguments"][0]["name"] = "changed"
+
+        second = metadata.to_dict()
+        assert second["arguments"][0] == {
+            "name": "value",
+            "type": int,
+            "description": None,
+            "required": True,
+            "default": FunctionMetadata.empty,
+        }
+
+    def test_parse_same_function_twice_returns_equal_metadata(self):
+        def cached_function(value: int, label: str = "x") -> str:
+            """Cached function.
+
+            Args:
+                value: The value
+                label: The label
+            """
+            return f"{label}{value}"
+
+        first = FunctionParser(cached_function).function_metadata
+        second = FunctionParser(cached_function).function_metadata
+
+        assert first == second
+        assert first is not second
+        assert first.arguments is not second.arguments
+
+    def test_parse_unhashable_bound_method(self):
+        class Unhashable:
+            __hash__ = None
+
+            def __call__(self, value: int):
+                return value
+
+        metadata = FunctionParser(Unhashable().__call__).function_metadata
+        assert [arg.name for arg in metadata.arguments] == ["value"]
+
+    def test_parsed_function_is_not_kept_alive(self):
+        def func(value: int) -> str:
+            return str(value)
+
+        FunctionParser(func)
+        func_ref = weakref.ref(func)
+        del func
+        gc.collect()
+
+        assert func_ref() is None
+
+    def test_docstring_parse_cached_per_docstring(self):
+        def first(value: int):
+            """Shared docstring.
+
+            Args:
+                value: The value
+            """
+
+        def second(value: int):
+            pass
+
+        second.__doc__ = first.__doc__
+
+        FunctionParser(first)
+        hits = FunctionParser._parse_docstring_parts.cache_info().hits
+        metadata = FunctionParser(second).function_metadata
+
+        assert FunctionParser._parse_docstring_parts.cache_info().hits == hits + 1
+        assert metadata.arguments[0].description == "The value"
+
+    def test_parameterless_function_skips_params_section(self):
+        def no_params():
+            """Title.
+
+            Some description.
+
+            Args:
+                unused: Not a parameter of this function
+            """
+
+        parser = FunctionParser(no_params)
+
+        assert parser._parsed_docstring["params"] == {}
+        assert parser.function_metadata.description == "Some description."
+
+    def test_unresolvable_type_hints_fall_back_to_default(self):
+        def func(value: "UndefinedType"):  # noqa: F821
+            pass
+
+        metadata = FunctionParser(func).function_metadata
+        assert metadata.arguments[0].type_hint is str
+
+
+class TestFileParser:
+    def test_parse_text_file_path(self, tmp_path):
+        file_path = tmp_path / "notes.txt"
+        file_path.write_text("hello world", encoding="utf-8")
+
+        metadata = FileParser(str(file_path)).file_metadata
+
+        assert metadata.name == "notes.txt"
+        assert metadata.size == 11
+        assert metadata.data == "hello world"
+        assert metadata.content_type == ContentTypes.TEXT
+        assert metadata.uri == f"file://{file_path}"
+
+    def test_parse_image_file_path(self, tmp_path):
+        file_path = tmp_path / "image.png"
+        file_path.write_bytes(b"\x89PNG\r\n\x1a\n\x00\xff")
+
+        metadata = FileParser(str(file_path)).file_metadata
+
+        assert metadata.name == "image.png"
+        assert metadata.content_type == ContentTypes.IMAGE
+        assert metadata.mime_type == MimeTypes.Image.PNG
+        assert base64.b64decode(metadata.data) == b"\x89PNG\r\n\x1a\n\x00\xff"
+
+    def test_parse_empty_file_path(self, tmp_path):
+        file_path = tmp_path / "empty.txt"
+        file_path.write_bytes(b"")
+
+        metadata = FileParser(str(file_path)).file_metadata
+
+        assert metadata.size == 0
+        assert metadata.data == ""
+        assert metadata.content_type == ContentTypes.TEXT
+
+    def test_parse_file_object(self, tmp_path):
+        file_path = tmp_path / "sound.mp3"
+        file_path.write_bytes(b"ID3\x00\x01")
+
+        with open(file_path, "rb") as f:
+            metadata = FileParser(f).file_metadata
+
+        assert metadata.name == "sound.mp3"
+        assert metadata.content_type == ContentTypes.AUDIO
+        assert base64.b64decode(metadata.data) == b"ID3\x00\x01"
+
+    def test_parse_large_file_path_is_memory_mapped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("mcp_serializer.features.base.parsers._MMAP_MIN_SIZE", 4)
+        file_path = tmp_path / "large.txt"
+        file_path.write_text("mapped content", encoding="utf-8")
+
+        metadata = FileParser(str(file_path)).file_metadata
+
+        assert metadata.size == 14
+        assert metadata.data == "mapped content"
+        assert metadata.content_type == ContentTypes.TEXT
+
+    def test_parse_large_binary_file_encodes_in_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("mcp_serializer.features.base.parsers._MMAP_MIN_SIZE", 4)
+        monkeypatch.setattr("mcp_serializer.features.base.parsers._B64_CHUNK_SIZE", 6)
+        content = bytes(range(256)) * 3 + b"\x01"
+        file_path = tmp_path / "image.png"
+        file_path.write_bytes(content)
+
+        metadata = FileParser(str(file_path)).file_metadata
+
+        assert metadata.data == base64.b64encode(content).decode("ascii")
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+    def test_parse_fifo_reads_until_eof(self, tmp_path, monkeypatch):
+        # A FIFO reports size 0 and must never be memory mapped
+        monkeypatch.setattr("mcp_serializer.features.base.parsers._MMAP_MIN_SIZE", 0)
+        file_path = tmp_path / "stream.txt"
+        os.mkfifo(file_path)
+
+        def write():
+            with open(file_path, "wb") as f:
+                f.write(b"streamed ")
+                f.flush()
+                f.write(b"content")
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            metadata = FileParser(str(file_path)).file_metadata
+        finally:
+            writer.join()
+
+        assert metadata.size == 16
+        assert metadata.data == "streamed content"
+        assert metadata.content_type == ContentTypes.TEXT
+
+    def test_parse_text_mode_file_object(self, tmp_path):
+        file_path = tmp_path / "notes.md"
+        file_path.write_text("# héllo", encoding="utf-8")
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            metadata = FileParser(f).file_metadata
+
+        assert metadata.data == "# héllo"
+        assert metadata.content_type == ContentTypes.TEXT
+
+    def test_large_non_utf8_text_file_is_rejected(self, tmp_path):
+        file_path = tmp_path / "data.txt"
+        file_path.write_bytes(b"\xff" + b"a" * 5000)
+
+        with pytest.raises(ValueError, match="Cannot determine file type"):
+            FileParser(str(file_path))
+
+    def test_large_text_file_with_multibyte_char_at_probe_boundary(self, tmp_path):
+        content = "a" * 4095 + "é" + "b" * 100
+        file_path = tmp_path / "data.txt"
+        file_path.write_text(content, encoding="utf-8")
+
+        metadata = FileParser(str(file_path)).file_metadata
+
+        assert metadata.data == content
+
+    def test_non_utf8_svg_falls_back_to_image(self, tmp_path):
+        file_path = tmp_path / "icon.svg"
+        file_path.write_bytes(b"\xff\xfe<svg/>")
+
+        metadata = FileParser(str(file_path)).file_metadata
+
+        assert metadata.content_type == ContentTypes.IMAGE
+        assert metadata.mime_type == MimeTypes.Image.SVG
+        assert base64.b64decode(metadata.data) == b"\xff\xfe<svg/>"
@@ -1,3 +1,4 @@
+import sys
 import pytest
 from typing import List, Dict, Set, Tuple, Optional, Union, Any
 from decimal import Decimal
@@ -368,6 +369,44 @@ class TestJsonSchemaPythonTypeToJsonSchema:
         assert result["additionalProperties"]["type"] == "array"
         assert result["additionalProperties"]["items"] == {"type": "integer"}
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="X | Y needs 3.10+")
+    def test_pep604_union_type(self):
+        """Test X | Y unions match their typing.Union equivalents."""
+        schema = JsonSchema()
+
+        assert schema._python_type_to_json_schema(int | None) == {"type": "integer"}
+        assert schema._python_type_to_json_schema(int | str) == {
+            "anyOf": [{"type": "integer"}, {"type": "string"}]
+        }
+
+    def test_union_member_order_is_kept(self):
+        """Test equal unions with different member order keep their order."""
+        schema = JsonSchema()
+
+        first = schema._python_type_to_json_schema(Union[int, str])
+        second = schema._python_type_to_json_schema(Union[str, int])
+
+        assert first["anyOf"] == [{"type": "integer"}, {"type": "string"}]
+        assert second["anyOf"] == [{"type": "string"}, {"type": "integer"}]
+
+    def test_returned_schema_is_independent_copy(self):
+        """Test mutating a returned schema does not leak into later calls."""
+        schema = JsonSchema()
+
+        result = schema._python_type_to_json_schema(Dict[str, List[int]])
+        result["description"] = "changed"
+        result["additionalProperties"]["items"]["type"] = "string"
+
+        result = schema._python_type_to_json_schema(Dict[str, List[int]])
+        assert result == {
+            "type": "object",
+            "additionalProperties": {"type": "array", "items": {"type": "integer"}},
+        }
+        assert schema._python_type_to_json_schema(List[int]) == {
+            "type": "array",
+            "items": {"type": "integer"},
+        }
+
 
 class TestCastPythonType:
     """Tests for cast_python_type function."""
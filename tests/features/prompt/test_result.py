@@ -29,6 +29,7 @@ class TestPromptsResult:
         assert PromptsResult.Roles.ASSISTANT.value == "assistant"
         assert PromptsResult.Roles.has_value("user") is True
         assert PromptsResult.Roles.has_value("invalid") is False
+        assert PromptsResult.Roles.has_value(["user"]) is False
 
         # Test with custom role
         custom_prompts = PromptsResult(role=PromptsResult.Roles.USER)
@@ -286,6 +287,17 @@ class TestPromptsResult:
         assert result.resource.text == "Resource text"
         assert result.resource.name == "Test"
 
+    def test_add_embedded_resource_unknown_uri_with_container(self):
+        prompts_content = PromptsResult(resource_container=ResourceContainer())
+
+        with pytest.raises(PromptsResult.ResourceNotFoundError):
+            prompts_content.add_embedded_resource("file://missing.txt")
+
+        result = prompts_content.add_embedded_resource(
+            "file://missing.txt", text="Fallback", mime_type="text/plain"
+        )
+        assert result.resource.text == "Fallback"
+
     def test_add_embedded_resource_errors(self):
         # Test without container and without data
         with pytest.raises(PromptsResult.ResourceContainerRequiredError):
@@ -306,6 +318,10 @@ class TestPromptsResult:
             # Testing the validation exists in the _add_message method
             self.prompts_content._add_message("invalid_role", "content")
 
+    def test_message_content_must_be_dict(self):
+        with pytest.raises(ValueError, match="Message content must be a dict"):
+            self.prompts_content._add_message(PromptsResult.Roles.USER, "not a dict")
+
     def test_complex_conversation_flow(self):
         """Test a realistic conversation with multiple content types and roles."""
         prompts_content = PromptsResult()
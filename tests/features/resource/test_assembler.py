@@ -74,6 +74,61 @@ class TestResourceSchemaAssembler:
         assert len(result["resourceTemplates"]) == 1
         assert result["resourceTemplates"][0]["uri"] == "file://test/{param}"
 
+    def test_get_resource_registry(self):
+        def static():
+            return "test"
+
+        def files(path: str):
+            return path
+
+        def docs(name: str):
+            return name
+
+        static_registry = FunctionRegistry(
+            FunctionParser(static).function_metadata, "file://static/"
+        )
+        files_registry = FunctionRegistry(
+            FunctionParser(files).function_metadata, "file://data"
+        )
+        docs_registry = FunctionRegistry(
+            FunctionParser(docs).function_metadata, "file://data/docs"
+        )
+        for registry in (static_registry, files_registry, docs_registry):
+            self.assembler.add_resource_registry(registry)
+
+        assert self.assembler.get_resource_registry("file://static") is (
+            static_registry
+        )
+        assert self.assembler.get_resource_registry("file://data/x") is (
+            files_registry
+        )
+        assert self.assembler.get_resource_registry("file://data/docs/x") is (
+            docs_registry
+        )
+        assert self.assembler.get_resource_registry("file://other") is None
+
+    def test_definition_kwargs_fall_back_to_metadata(self):
+        def sample_func(param: str):
+            """Sample title
+
+            Sample description
+            """
+            return f"test-{param}"
+
+        registry = FunctionRegistry(
+            FunctionParser(sample_func).function_metadata, "file://test"
+        )
+        registry.extra = {"title": "Custom title", "mime_type": "text/plain"}
+
+        kwargs = registry.definition_kwargs
+
+        assert kwargs["uri"] == "file://test/{param}"
+        assert kwargs["name"] == "sample_func"
+        assert kwargs["title"] == "Custom title"
+        assert kwargs["description"] == "Sample description"
+        assert kwargs["mimeType"] == "text/plain"
+        assert registry.definition_kwargs is kwargs
+
     def test_process_content_text(self):
         def sample_func():
             return "test"
@@ -119,6 +174,30 @@ class TestResourceSchemaAssembler:
         assert result["contents"][0]["mimeType"] == "application/octet-stream"
         assert result["contents"][0]["annotations"] == annotation.model_dump()
 
+    def test_process_content_leaves_result_untouched(self):
+        def sample_func():
+            return "test"
+
+        registry = FunctionRegistry(
+            FunctionParser(sample_func).function_metadata, "file://test.txt"
+        )
+        registry.extra = {"name": "test-file", "annotations": {"priority": 0.5}}
+
+        resource_result = ResourceResult()
+        resource_result.add_text_content(text="first", mime_type="text/plain")
+        resource_result.add_text_content(text="second", mime_type="text/plain")
+
+        result = self.assembler.process_content(resource_result, registry)
+
+        assert result["contents"][0]["uri"] == "file://test.txt"
+        assert result["contents"][0]["name"] == "test-file"
+        assert result["contents"][0]["annotations"] == {"priority": 0.5}
+        assert result["contents"][1] == {"text": "second", "mimeType": "text/plain"}
+        first = resource_result.content_list[0]
+        assert first.uri is None
+        assert first.name is None
+        assert first.annotations is None
+
     def test_process_content_unsupported_type(self):
         def sample_func():
             return "test"
@@ -62,6 +62,18 @@ class TestResourceContent:
                 "invalid_base64!", "application/octet-stream"
             )
 
+    def test_add_binary_content_rejects_malformed_padding(self):
+        with pytest.raises(ValueError, match="Blob must be valid base64 encoded data"):
+            self.resource_content.add_binary_content("AAA==", "application/octet-stream")
+
+        with pytest.raises(ValueError, match="Blob must be valid base64 encoded data"):
+            self.resource_content.add_binary_content("aGVsbG8", "application/octet-stream")
+
+        result = self.resource_content.add_binary_content(
+            "aGVsbG8=", "application/octet-stream"
+        )
+        assert result.blob == "aGVsbG8="
+
     def test_add_file_text_content(self):
         test_content = "This is a test file content"
 
@@ -106,6 +106,15 @@ class TestResourceContainer:
         assert registry is not None
         assert registry.uri == "file://test.txt"
 
+    def test_find_exact_match_registered_with_trailing_slash(self):
+        result = ResourceResult()
+        result.add_text_content("content")
+        self.container.add_resource("file://docs/", result=result)
+
+        registry = self.container._find_exact_match("file://docs")
+
+        assert registry is self.container.registrations["file://docs/"]
+
     def test_find_exact_match_not_found(self):
         registry = self.container._find_exact_match("file://nonexistent.txt")
         assert registry is None
@@ -120,10 +129,36 @@ class TestResourceContainer:
         assert registry is not None
         assert registry.uri == "file://test"
 
+    def test_find_prefix_match_prefers_longest_uri(self):
+        def files(path: str):
+            return path
+
+        def docs(name: str):
+            return name
+
+        self.container.register(files, "file://data")
+        self.container.register(docs, "file://data/docs")
+
+        registry = self.container._find_prefix_match("file://data/docs/readme")
+        assert registry.uri == "file://data/docs"
+
+        registry = self.container._find_prefix_match("file://data/other")
+        assert registry.uri == "file://data"
+
     def test_find_prefix_match_not_found(self):
         registry = self.container._find_prefix_match("file://nonexistent")
         assert registry is None
 
+    def test_has_uri(self):
+        def sample_func(param: str):
+            return param
+
+        self.container.register(sample_func, "file://test")
+
+        assert self.container.has_uri("file://test")
+        assert self.container.has_uri("file://test/value")
+        assert not self.container.has_uri("file://other")
+
     def test_extract_path_params_function_registry(self):
         def sample_func(param1: str, param2: str):
             return "test"
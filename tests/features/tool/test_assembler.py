@@ -1,8 +1,13 @@
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 from mcp_serializer.features.tool.assembler import ToolsSchemaAssembler
 from mcp_serializer.features.tool.container import ToolRegistry
 from mcp_serializer.features.tool.result import ToolsResult
+from mcp_serializer.features.tool.schema import (
+    ToolsListSchema,
+    ResultSchema,
+    TextContent,
+)
 from mcp_serializer.features.base.parsers import FunctionParser
 from mcp_serializer.features.base.assembler import FeatureSchemaAssembler
 
@@ -102,6 +107,27 @@ class TestToolsSchemaAssembler:
         assert "message" in schema_dict["properties"]
         assert "status" in schema_dict["properties"]
 
+    def test_create_output_schema_reuses_model_fields(self):
+        def first() -> SampleResponse:
+            return SampleResponse(message="a", status=1)
+
+        def second() -> SampleResponse:
+            return SampleResponse(message="b", status=2)
+
+        first_schema = self.assembler._create_output_schema(
+            FunctionParser(first).function_metadata
+        )
+        second_schema = self.assembler._create_output_schema(
+            FunctionParser(second).function_metadata
+        )
+
+        assert first_schema.model_dump() == second_schema.model_dump()
+        assert first_schema.properties is not second_schema.properties
+        first_schema.properties["message"]["description"] = "changed"
+        assert second_schema.properties["message"]["description"] == (
+            "Response message"
+        )
+
     def test_build_list_result_schema(self):
         def sample_func():
             return "test"
@@ -167,6 +193,34 @@ class TestToolsSchemaAssembler:
         assert "content" in result
         assert len(result["content"]) == 1
 
+    def test_process_result_content_matches_model_dump(self):
+        tools_result = ToolsResult()
+        text = tools_result.add_text_content("Test", annotations={"priority": 1})
+        image = tools_result.add_image_content("aGVsbG8=", "image/png")
+        link = tools_result.add_resource_link("https://example.com/a.txt")
+
+        result = self.assembler.process_result(tools_result)
+
+        assert result["content"] == [
+            self.assembler._build_non_none_dict(item) for item in (text, image, link)
+        ]
+        result["content"][0]["annotations"]["priority"] = 2
+        assert text.annotations == {"priority": 1}
+
+    def test_process_result_content_uses_model_serialization(self):
+        class LabelledText(TextContent):
+            @computed_field
+            @property
+            def label(self) -> str:
+                return self.text.upper()
+
+        tools_result = ToolsResult()
+        tools_result.content_list.append(LabelledText(text="hi"))
+
+        result = self.assembler.process_result(tools_result)
+
+        assert result["content"] == [{"type": "text", "text": "hi", "label": "HI"}]
+
     def test_process_result_pydantic_model(self):
         sample_response = SampleResponse(message="test", status=200)
 
@@ -176,6 +230,24 @@ class TestToolsSchemaAssembler:
         assert result["structuredContent"]["message"] == "test"
         assert result["structuredContent"]["status"] == 200
 
+    def test_results_validate_against_public_models(self):
+        def sample_func():
+            return "test"
+
+        metadata = FunctionParser(sample_func).function_metadata
+        self.assembler.add_tool_registry(ToolRegistry(metadata, {"name": "tool"}))
+
+        tools_list = ToolsListSchema.model_validate(
+            self.assembler.build_list_result_schema()
+        )
+        result = ResultSchema.model_validate(self.assembler.process_result("hello"))
+
+        assert tools_list.tools[0]["name"] == "tool"
+        assert result.content == [{"type": "text", "text": "hello"}]
+
+    def test_process_result_empty_tools_result(self):
+        assert self.assembler.process_result(ToolsResult()) == {"content": []}
+
     def test_process_result_unsupported_type(self):
         with pytest.raises(FeatureSchemaAssembler.UnsupportedResultTypeError):
             self.assembler.process_result(["invalid_content"])
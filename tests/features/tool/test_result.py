@@ -10,6 +10,7 @@ from mcp_serializer.features.tool.schema import (
     EmbeddedResource,
 )
 from mcp_serializer.features.base.definitions import FileMetadata, ContentTypes
+from mcp_serializer.features.resource.assembler import ResourceSchemaAssembler
 import base64
 
 
@@ -180,8 +181,8 @@ class TestToolsResult:
             "mime_type": "text/plain",
         }
 
-        mock_container.schema_assembler.resource_list = [mock_resource]
-        mock_container.schema_assembler.resource_template_list = []
+        mock_container.schema_assembler = ResourceSchemaAssembler()
+        mock_container.schema_assembler.add_resource_registry(mock_resource)
         mock_registry.resource_container = mock_container
 
         result = self.tools_content.add_resource_link(
@@ -234,6 +234,23 @@ def test_resources_read_request():
     assert "Config: app" in str(response.response_data["result"])
 
 
+def test_resources_read_not_found():
+    """Test reading a resource that is not registered."""
+    request = {
+        "jsonrpc": "2.0",
+        "id": 8,
+        "method": "resources/read",
+        "params": {"uri": "unknown://nothing"},
+    }
+
+    response = serializer.process_request(request)
+
+    assert response is not None
+    error = response.response_data["error"]
+    assert error["code"] == -32004  # Resource not found
+    assert error["data"]["uri"] == "unknown://nothing"
+
+
 def test_file_resource():
     """Test reading a file-based resource."""
     # Get the URI for the temp file from the registry
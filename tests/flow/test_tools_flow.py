@@ -227,6 +227,48 @@ def test_json_string_request():
     assert "result" in response.response_data
 
 
+def test_json_bytes_request():
+    """Test request as UTF-8 encoded JSON bytes."""
+    request_bytes = json.dumps(
+        {"jsonrpc": "2.0", "id": 18, "method": "tools/list", "params": {}}
+    ).encode("utf-8")
+
+    response = serializer.process_request(request_bytes)
+
+    assert response.response_data["id"] == 18
+    assert "result" in response.response_data
+
+
+def test_json_bytearray_request():
+    """Test request as a bytearray of JSON."""
+    request_bytes = bytearray(
+        json.dumps({"jsonrpc": "2.0", "id": 19, "method": "tools/list", "params": {}}),
+        "utf-8",
+    )
+
+    response = serializer.process_request(request_bytes)
+
+    assert response.response_data["id"] == 19
+    assert "result" in response.response_data
+
+
+def test_json_parsing_matches_stdlib():
+    """Test that request strings parse exactly as json.loads parses them."""
+    request_str = (
+        '{"id": 123456789012345678901234567890, "nan": NaN, "inf": Infinity,'
+        ' "text": "\\ud800"}'
+    )
+
+    for data in (request_str, request_str.encode("utf-8")):
+        parsed = serializer.validate(data)
+
+        assert parsed["id"] == 123456789012345678901234567890
+        assert isinstance(parsed["id"], int)
+        assert parsed["nan"] != parsed["nan"]
+        assert parsed["inf"] == float("inf")
+        assert parsed["text"] == "\ud800"
+
+
 def test_batch_request():
     """Test batch request processing with tools."""
     batch_request = [
@@ -246,3 +288,15 @@ def test_batch_request():
     assert len(response_context.response_data) == 2
     assert len(response_context.history) == 2
     assert all("result" in resp for resp in response_context.response_data)
+
+
+def test_batch_request_with_invalid_item():
+    """Test a batch containing a request without a method."""
+    batch_request = [
+        {"jsonrpc": "2.0", "id": 13, "method": "tools/list", "params": {}},
+        {"jsonrpc": "2.0", "id": 14, "params": {}},
+    ]
+
+    response_context = serializer.process_request(batch_request)
+
+    assert response_context.response_data["error"]["code"] == -32700  # Parse error